@@ -10,14 +10,21 @@ Settings can be configured via:
 The ~/.clump/config.json is the recommended place for persistent settings.
 """
 
+import copy
 import json
+import logging
 import os
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Literal
 
+logger = logging.getLogger(__name__)
 
-# Default tools to auto-approve for issue analysis
-DEFAULT_ALLOWED_TOOLS = [
+# Default tools to auto-approve for issue analysis (immutable, so it can be
+# handed out without copying)
+DEFAULT_ALLOWED_TOOLS = (
     "Read",
     "Glob",
     "Grep",
@@ -25,7 +32,13 @@ DEFAULT_ALLOWED_TOOLS = [
     "Bash(git log:*)",
     "Bash(git diff:*)",
     "Bash(git show:*)",
-]
+)
+
+# GitHub's hosted MCP server; only the Authorization header varies per token
+_GITHUB_MCP_BASE = {
+    "type": "http",
+    "url": "https://api.githubcopilot.com/mcp/",
+}
 
 
 def _get_clump_config_path() -> Path:
@@ -74,6 +87,32 @@ def _load_env_file() -> dict[str, str]:
     return env_vars
 
 
+@lru_cache(maxsize=32)
+def _split_csv(value: str) -> tuple[str, ...]:
+    """Split a comma-separated setting into stripped items, parsed once per value."""
+    if not value:
+        return ()
+    return tuple(item.strip() for item in value.split(","))
+
+
+@lru_cache(maxsize=8)
+def _parse_mcp_servers(raw: str) -> dict | None:
+    """
+    Parse the claude_mcp_servers JSON object, or None if it isn't one.
+
+    Cached so a misconfigured value doesn't raise on every call.
+    """
+    raw = raw.strip()
+    if not raw.startswith("{"):
+        return None
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        logger.warning("Ignoring invalid JSON in claude_mcp_servers")
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
 class Settings:
     """
     Application settings with layered configuration.
@@ -85,9 +124,12 @@ class Settings:
     4. Default values
     """
 
+    __slots__ = ("_clump_config", "_env_file")
+
     def __init__(self):
-        # Load config sources
-        self._clump_config = _load_clump_config()
+        # Load config sources. The clump config is exposed read-only;
+        # writes go through _save_clump_config followed by reload().
+        self._clump_config: Mapping = MappingProxyType(_load_clump_config())
         self._env_file = _load_env_file()
 
     def _get(self, key: str, default=None, env_key: str | None = None):
@@ -186,6 +228,15 @@ class Settings:
             return fmt  # type: ignore
         return "stream-json"
 
+    @property
+    def claude_mcp_github(self) -> bool:
+        return self._get_bool("claude_mcp_github", False, "CLAUDE_MCP_GITHUB")
+
+    @property
+    def claude_mcp_servers(self) -> str:
+        """Additional MCP servers as a JSON object string."""
+        return self._get("claude_mcp_servers", "", "CLAUDE_MCP_SERVERS") or ""
+
     # ==========================================
     # Gemini CLI Settings
     # ==========================================
@@ -228,19 +279,34 @@ class Settings:
 
     def get_allowed_tools(self) -> list[str]:
         """Get list of allowed tools, using defaults if not specified."""
-        if self.claude_allowed_tools:
-            return [t.strip() for t in self.claude_allowed_tools.split(",")]
-        return DEFAULT_ALLOWED_TOOLS
+        return list(_split_csv(self.claude_allowed_tools) or DEFAULT_ALLOWED_TOOLS)
 
     def get_disallowed_tools(self) -> list[str]:
         """Get list of disallowed tools."""
-        if self.claude_disallowed_tools:
-            return [t.strip() for t in self.claude_disallowed_tools.split(",")]
-        return []
+        return list(_split_csv(self.claude_disallowed_tools))
+
+    def get_mcp_config(self) -> dict | None:
+        """Get MCP server config for --mcp-config, or None if nothing is configured."""
+        servers = {}
+
+        token = self.github_token
+        if self.claude_mcp_github and token:
+            servers["github"] = {
+                **_GITHUB_MCP_BASE,
+                "headers": {"Authorization": f"Bearer {token}"},
+            }
+
+        extra = _parse_mcp_servers(self.claude_mcp_servers)
+        if extra:
+            # The parsed servers live in the lru_cache; hand out a copy so
+            # callers can't alter what later calls return
+            servers.update(copy.deepcopy(extra))
+
+        return servers or None
 
     def reload(self) -> None:
         """Reload config from files."""
-        self._clump_config = _load_clump_config()
+        self._clump_config = MappingProxyType(_load_clump_config())
         self._env_file = _load_env_file()
 
 
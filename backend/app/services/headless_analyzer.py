@@ -27,6 +27,9 @@ logger = logging.getLogger(__name__)
 # Large tool outputs (e.g., file reads, grep results) can exceed the default 64KB.
 SUBPROCESS_BUFFER_LIMIT_BYTES = 10 * 1024 * 1024  # 10 MB
 
+# Grace period for a cancelled session to exit after SIGTERM before it is killed.
+CANCEL_TERMINATE_TIMEOUT_SECS = 5.0
+
 
 @dataclass
 class SessionMessage:
@@ -287,7 +290,7 @@ class HeadlessAnalyzer:
         if process:
             process.terminate()
             try:
-                await asyncio.wait_for(process.wait(), timeout=5.0)
+                await asyncio.wait_for(process.wait(), timeout=CANCEL_TERMINATE_TIMEOUT_SECS)
             except asyncio.TimeoutError:
                 process.kill()
             return True
@@ -1,8 +1,39 @@
 """Pytest configuration and fixtures for backend tests."""
 
+import copy
 import pytest
 import sys
 from pathlib import Path
 
 # Add the app directory to the path so we can import from it
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import Settings
+
+
+@pytest.fixture(scope="session")
+def settings_proto():
+    """Build Settings once per session; it reads env, config.json and .env."""
+    return Settings()
+
+
+@pytest.fixture
+def settings(settings_proto):
+    """Fresh Settings copy with empty file-based config sources."""
+    s = copy.copy(settings_proto)
+    s._clump_config = {}
+    s._env_file = {}
+    return s
+
+
+@pytest.fixture
+def repo_store(monkeypatch, repo_row):
+    """Repo rows keyed by id, served to get_repo_or_404 in place of the registry.
+
+    Seeded as id 1 from a ``repo_row`` fixture, which each module using this
+    must define as a registry row dict. Unknown ids hit the real 404 path;
+    tests can add or swap rows in the dict.
+    """
+    store = {1: repo_row}
+    monkeypatch.setattr("app.db_helpers.get_repo_by_id", store.get)
+    return store
@@ -1,5 +1,6 @@
 """Tests for app.config module."""
 
+import copy
 import pytest
 import os
 from unittest.mock import patch, MagicMock
@@ -9,10 +10,9 @@ from app.config import Settings, DEFAULT_ALLOWED_TOOLS
 class TestSettingsGet:
     """Tests for Settings._get method."""
 
-    def test_returns_env_var_first(self):
+    def test_returns_env_var_first(self, settings):
         """Environment variable takes highest priority."""
         with patch.dict(os.environ, {"TEST_KEY": "env_value"}):
-            settings = Settings()
             settings._clump_config = {"test_key": "config_value"}
             settings._env_file = {"TEST_KEY": "env_file_value"}
 
@@ -20,12 +20,11 @@ class TestSettingsGet:
 
             assert result == "env_value"
 
-    def test_returns_clump_config_second(self):
+    def test_returns_clump_config_second(self, settings):
         """Clump config is used when env var not set."""
         with patch.dict(os.environ, {}, clear=False):
             # Ensure TEST_KEY_2 is not in environ
             os.environ.pop("TEST_KEY_2", None)
-            settings = Settings()
             settings._clump_config = {"test_key": "config_value"}
             settings._env_file = {"TEST_KEY_2": "env_file_value"}
 
@@ -33,11 +32,10 @@ class TestSettingsGet:
 
             assert result == "config_value"
 
-    def test_returns_env_file_third(self):
+    def test_returns_env_file_third(self, settings):
         """Env file is used when env var and clump config not set."""
         with patch.dict(os.environ, {}, clear=False):
             os.environ.pop("TEST_KEY_3", None)
-            settings = Settings()
             settings._clump_config = {}
             settings._env_file = {"TEST_KEY_3": "env_file_value"}
 
@@ -45,11 +43,10 @@ class TestSettingsGet:
 
             assert result == "env_file_value"
 
-    def test_returns_default_last(self):
+    def test_returns_default_last(self, settings):
         """Default is used when nothing else is set."""
         with patch.dict(os.environ, {}, clear=False):
             os.environ.pop("NONEXISTENT_KEY", None)
-            settings = Settings()
             settings._clump_config = {}
             settings._env_file = {}
 
@@ -57,10 +54,9 @@ class TestSettingsGet:
 
             assert result == "my_default"
 
-    def test_uses_uppercase_key_for_env_by_default(self):
+    def test_uses_uppercase_key_for_env_by_default(self, settings):
         """Uses uppercase of key as env_key if not specified."""
         with patch.dict(os.environ, {"MY_SETTING": "from_env"}):
-            settings = Settings()
             settings._clump_config = {}
             settings._env_file = {}
 
@@ -72,126 +68,112 @@ class TestSettingsGet:
 class TestSettingsGetBool:
     """Tests for Settings._get_bool method."""
 
-    def test_returns_true_for_bool_true(self):
+    def test_returns_true_for_bool_true(self, settings):
         """Returns True when value is boolean True."""
-        settings = Settings()
         settings._clump_config = {"test_bool": True}
 
         result = settings._get_bool("test_bool", False)
 
         assert result is True
 
-    def test_returns_false_for_bool_false(self):
+    def test_returns_false_for_bool_false(self, settings):
         """Returns False when value is boolean False."""
-        settings = Settings()
         settings._clump_config = {"test_bool": False}
 
         result = settings._get_bool("test_bool", True)
 
         assert result is False
 
-    def test_returns_true_for_string_true(self):
+    def test_returns_true_for_string_true(self, settings):
         """Returns True for string 'true'."""
-        settings = Settings()
         settings._clump_config = {"test_bool": "true"}
 
         result = settings._get_bool("test_bool", False)
 
         assert result is True
 
-    def test_returns_true_for_string_TRUE(self):
+    def test_returns_true_for_string_TRUE(self, settings):
         """Returns True for string 'TRUE' (case insensitive)."""
-        settings = Settings()
         settings._clump_config = {"test_bool": "TRUE"}
 
         result = settings._get_bool("test_bool", False)
 
         assert result is True
 
-    def test_returns_true_for_string_1(self):
+    def test_returns_true_for_string_1(self, settings):
         """Returns True for string '1'."""
-        settings = Settings()
         settings._clump_config = {"test_bool": "1"}
 
         result = settings._get_bool("test_bool", False)
 
         assert result is True
 
-    def test_returns_true_for_string_yes(self):
+    def test_returns_true_for_string_yes(self, settings):
         """Returns True for string 'yes'."""
-        settings = Settings()
         settings._clump_config = {"test_bool": "yes"}
 
         result = settings._get_bool("test_bool", False)
 
         assert result is True
 
-    def test_returns_true_for_string_YES(self):
+    def test_returns_true_for_string_YES(self, settings):
         """Returns True for string 'YES' (case insensitive)."""
-        settings = Settings()
         settings._clump_config = {"test_bool": "YES"}
 
         result = settings._get_bool("test_bool", False)
 
         assert result is True
 
-    def test_returns_false_for_string_false(self):
+    def test_returns_false_for_string_false(self, settings):
         """Returns False for string 'false'."""
-        settings = Settings()
         settings._clump_config = {"test_bool": "false"}
 
         result = settings._get_bool("test_bool", True)
 
         assert result is False
 
-    def test_returns_false_for_string_0(self):
+    def test_returns_false_for_string_0(self, settings):
         """Returns False for string '0'."""
-        settings = Settings()
         settings._clump_config = {"test_bool": "0"}
 
         result = settings._get_bool("test_bool", True)
 
         assert result is False
 
-    def test_returns_false_for_string_no(self):
+    def test_returns_false_for_string_no(self, settings):
         """Returns False for string 'no'."""
-        settings = Settings()
         settings._clump_config = {"test_bool": "no"}
 
         result = settings._get_bool("test_bool", True)
 
         assert result is False
 
-    def test_returns_false_for_empty_string(self):
+    def test_returns_false_for_empty_string(self, settings):
         """Returns False for empty string."""
-        settings = Settings()
         settings._clump_config = {"test_bool": ""}
 
         result = settings._get_bool("test_bool", True)
 
         assert result is False
 
-    def test_returns_true_for_integer_1(self):
+    def test_returns_true_for_integer_1(self, settings):
         """Returns True for integer 1."""
-        settings = Settings()
         settings._clump_config = {"test_bool": 1}
 
         result = settings._get_bool("test_bool", False)
 
         assert result is True
 
-    def test_returns_false_for_integer_0(self):
+    def test_returns_false_for_integer_0(self, settings):
         """Returns False for integer 0."""
-        settings = Settings()
         settings._clump_config = {"test_bool": 0}
 
         result = settings._get_bool("test_bool", True)
 
         assert result is False
 
-    def test_returns_default_for_nonexistent_key(self):
+    def test_returns_default_for_nonexistent_key(self, settings):
         """Returns default when key doesn't exist."""
-        settings = Settings()
         settings._clump_config = {}
 
         result = settings._get_bool("nonexistent", True)
@@ -202,81 +184,72 @@ class TestSettingsGetBool:
 class TestSettingsGetInt:
     """Tests for Settings._get_int method."""
 
-    def test_returns_int_value(self):
+    def test_returns_int_value(self, settings):
         """Returns integer value directly."""
-        settings = Settings()
         settings._clump_config = {"test_int": 42}
 
         result = settings._get_int("test_int", 0)
 
         assert result == 42
 
-    def test_converts_string_to_int(self):
+    def test_converts_string_to_int(self, settings):
         """Converts string to integer."""
-        settings = Settings()
         settings._clump_config = {"test_int": "123"}
 
         result = settings._get_int("test_int", 0)
 
         assert result == 123
 
-    def test_converts_negative_string_to_int(self):
+    def test_converts_negative_string_to_int(self, settings):
         """Converts negative string to integer."""
-        settings = Settings()
         settings._clump_config = {"test_int": "-42"}
 
         result = settings._get_int("test_int", 0)
 
         assert result == -42
 
-    def test_returns_default_for_invalid_string(self):
+    def test_returns_default_for_invalid_string(self, settings):
         """Returns default for non-numeric string."""
-        settings = Settings()
         settings._clump_config = {"test_int": "not_a_number"}
 
         result = settings._get_int("test_int", 99)
 
         assert result == 99
 
-    def test_returns_default_for_float_string(self):
+    def test_returns_default_for_float_string(self, settings):
         """Returns default for float string (not valid int)."""
-        settings = Settings()
         settings._clump_config = {"test_int": "3.14"}
 
         result = settings._get_int("test_int", 99)
 
         assert result == 99
 
-    def test_returns_default_for_empty_string(self):
+    def test_returns_default_for_empty_string(self, settings):
         """Returns default for empty string."""
-        settings = Settings()
         settings._clump_config = {"test_int": ""}
 
         result = settings._get_int("test_int", 99)
 
         assert result == 99
 
-    def test_returns_default_for_none(self):
+    def test_returns_default_for_none(self, settings):
         """Returns default for None value."""
-        settings = Settings()
         settings._clump_config = {"test_int": None}
 
         result = settings._get_int("test_int", 99)
 
         assert result == 99
 
-    def test_returns_default_for_nonexistent_key(self):
+    def test_returns_default_for_nonexistent_key(self, settings):
         """Returns default when key doesn't exist."""
-        settings = Settings()
         settings._clump_config = {}
 
         result = settings._get_int("nonexistent", 42)
 
         assert result == 42
 
-    def test_converts_float_to_int(self):
+    def test_converts_float_to_int(self, settings):
         """Converts float value to integer."""
-        settings = Settings()
         settings._clump_config = {"test_int": 3.9}
 
         result = settings._get_int("test_int", 0)
@@ -284,23 +257,42 @@ class TestSettingsGetInt:
         assert result == 3
 
 
+class TestSettingsSlots:
+    """Tests for Settings instance layout."""
+
+    def test_has_no_instance_dict(self, settings):
+        """Settings declares __slots__, so instances carry no __dict__."""
+        assert not hasattr(settings, "__dict__")
+
+    def test_copy_preserves_slot_values(self, settings):
+        """Shallow copies keep the config sources (used by the test fixture)."""
+        settings._clump_config = {"key": "value"}
+
+        clone = copy.copy(settings)
+
+        assert clone._clump_config == {"key": "value"}
+
+
 class TestSettingsReload:
     """Tests for Settings.reload method."""
 
-    def test_reload_updates_clump_config(self):
+    def test_reload_updates_clump_config(self, settings):
         """Reload refreshes clump config from file."""
-        settings = Settings()
-        original_config = settings._clump_config.copy()
-
         with patch("app.config._load_clump_config", return_value={"new_key": "new_value"}):
             settings.reload()
 
         assert settings._clump_config == {"new_key": "new_value"}
 
-    def test_reload_updates_env_file(self):
-        """Reload refreshes env file values."""
-        settings = Settings()
+    def test_reload_exposes_clump_config_read_only(self, settings):
+        """The reloaded clump config can't be mutated in place."""
+        with patch("app.config._load_clump_config", return_value={"key": "value"}):
+            settings.reload()
+
+        with pytest.raises(TypeError):
+            settings._clump_config["key"] = "changed"
 
+    def test_reload_updates_env_file(self, settings):
+        """Reload refreshes env file values."""
         with patch("app.config._load_env_file", return_value={"NEW_VAR": "value"}):
             settings.reload()
 
@@ -310,24 +302,21 @@ class TestSettingsReload:
 class TestClaudePermissionMode:
     """Tests for claude_permission_mode property."""
 
-    def test_returns_valid_mode(self):
+    def test_returns_valid_mode(self, settings):
         """Returns valid permission mode."""
-        settings = Settings()
         settings._clump_config = {"claude_permission_mode": "plan"}
 
         assert settings.claude_permission_mode == "plan"
 
-    def test_returns_default_for_invalid_mode(self):
+    def test_returns_default_for_invalid_mode(self, settings):
         """Returns 'acceptEdits' for invalid mode."""
-        settings = Settings()
         settings._clump_config = {"claude_permission_mode": "invalid_mode"}
 
         assert settings.claude_permission_mode == "acceptEdits"
 
-    def test_all_valid_modes(self):
+    def test_all_valid_modes(self, settings):
         """Tests all valid permission modes."""
         valid_modes = ["default", "plan", "acceptEdits", "bypassPermissions"]
-        settings = Settings()
 
         for mode in valid_modes:
             settings._clump_config = {"claude_permission_mode": mode}
@@ -337,24 +326,21 @@ class TestClaudePermissionMode:
 class TestClaudeOutputFormat:
     """Tests for claude_output_format property."""
 
-    def test_returns_valid_format(self):
+    def test_returns_valid_format(self, settings):
         """Returns valid output format."""
-        settings = Settings()
         settings._clump_config = {"claude_output_format": "json"}
 
         assert settings.claude_output_format == "json"
 
-    def test_returns_default_for_invalid_format(self):
+    def test_returns_default_for_invalid_format(self, settings):
         """Returns 'stream-json' for invalid format."""
-        settings = Settings()
         settings._clump_config = {"claude_output_format": "invalid_format"}
 
         assert settings.claude_output_format == "stream-json"
 
-    def test_all_valid_formats(self):
+    def test_all_valid_formats(self, settings):
         """Tests all valid output formats."""
         valid_formats = ["text", "json", "stream-json"]
-        settings = Settings()
 
         for fmt in valid_formats:
             settings._clump_config = {"claude_output_format": fmt}
@@ -364,105 +350,106 @@ class TestClaudeOutputFormat:
 class TestGetAllowedTools:
     """Tests for Settings.get_allowed_tools method."""
 
-    def test_returns_defaults_when_empty(self):
+    def test_returns_defaults_when_empty(self, settings):
         """When claude_allowed_tools is empty, returns DEFAULT_ALLOWED_TOOLS."""
         with patch.object(Settings, 'claude_allowed_tools', ""):
-            settings = Settings()
-            result = settings.get_allowed_tools()
-            assert result == DEFAULT_ALLOWED_TOOLS
-
-    def test_parses_comma_separated_tools(self):
-        """Parses a comma-separated list of tools."""
-        with patch.object(Settings, 'claude_allowed_tools', "Read,Glob,Grep"):
-            settings = Settings()
             result = settings.get_allowed_tools()
-            assert result == ["Read", "Glob", "Grep"]
+            assert result == list(DEFAULT_ALLOWED_TOOLS)
 
-    def test_strips_whitespace(self):
-        """Strips whitespace around tool names."""
-        with patch.object(Settings, 'claude_allowed_tools', "  Read  ,  Glob  ,  Grep  "):
-            settings = Settings()
-            result = settings.get_allowed_tools()
-            assert result == ["Read", "Glob", "Grep"]
+    def test_returns_fresh_list(self, settings):
+        """Callers can mutate the result without touching the defaults or the parse cache."""
+        with patch.object(Settings, 'claude_allowed_tools', ""):
+            settings.get_allowed_tools().append("Write")
+            assert settings.get_allowed_tools() == list(DEFAULT_ALLOWED_TOOLS)
 
-    def test_handles_single_tool(self):
-        """Handles a single tool without commas."""
         with patch.object(Settings, 'claude_allowed_tools', "Read"):
-            settings = Settings()
+            settings.get_allowed_tools().append("Write")
+            assert settings.get_allowed_tools() == ["Read"]
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("Read,Glob,Grep", ["Read", "Glob", "Grep"]),
+        ("  Read  ,  Glob  ,  Grep  ", ["Read", "Glob", "Grep"]),
+        ("Read", ["Read"]),
+        ("Read,Bash(git:*),Glob", ["Read", "Bash(git:*)", "Glob"]),
+    ], ids=["comma_separated", "strips_whitespace", "single_tool", "bash_patterns"])
+    def test_parses_tools(self, settings, raw, expected):
+        """Parses comma-separated tools, stripping whitespace and keeping Bash patterns."""
+        with patch.object(Settings, 'claude_allowed_tools', raw):
             result = settings.get_allowed_tools()
-            assert result == ["Read"]
-
-    def test_handles_bash_patterns(self):
-        """Handles Bash patterns with colons and wildcards."""
-        with patch.object(Settings, 'claude_allowed_tools', "Read,Bash(git:*),Glob"):
-            settings = Settings()
-            result = settings.get_allowed_tools()
-            assert result == ["Read", "Bash(git:*)", "Glob"]
+            assert result == expected
 
 
 class TestGetDisallowedTools:
     """Tests for Settings.get_disallowed_tools method."""
 
-    def test_returns_empty_list_when_not_set(self):
-        """Returns empty list when no tools are disallowed."""
-        with patch.object(Settings, 'claude_disallowed_tools', ""):
-            settings = Settings()
-            result = settings.get_disallowed_tools()
-            assert result == []
-
-    def test_parses_comma_separated_tools(self):
-        """Parses a comma-separated list of disallowed tools."""
-        with patch.object(Settings, 'claude_disallowed_tools', "Write,Edit"):
-            settings = Settings()
-            result = settings.get_disallowed_tools()
-            assert result == ["Write", "Edit"]
-
-    def test_strips_whitespace(self):
-        """Strips whitespace around tool names."""
-        with patch.object(Settings, 'claude_disallowed_tools', "  Write  ,  Edit  "):
-            settings = Settings()
+    @pytest.mark.parametrize("raw, expected", [
+        ("", []),
+        ("Write,Edit", ["Write", "Edit"]),
+        ("  Write  ,  Edit  ", ["Write", "Edit"]),
+    ], ids=["not_set", "comma_separated", "strips_whitespace"])
+    def test_parses_tools(self, settings, raw, expected):
+        """Parses comma-separated disallowed tools, empty when not set."""
+        with patch.object(Settings, 'claude_disallowed_tools', raw):
             result = settings.get_disallowed_tools()
-            assert result == ["Write", "Edit"]
+            assert result == expected
 
 
 class TestGetMcpConfig:
     """Tests for Settings.get_mcp_config method."""
 
-    def test_returns_none_when_no_mcp_configured(self):
+    def test_returns_none_when_no_mcp_configured(self, settings):
         """Returns None when no MCP servers are configured."""
         with patch.object(Settings, 'claude_mcp_github', False), \
              patch.object(Settings, 'claude_mcp_servers', ""):
-            settings = Settings()
             result = settings.get_mcp_config()
             assert result is None
 
-    def test_adds_github_mcp_when_enabled(self):
+    def test_adds_github_mcp_when_enabled(self, settings):
         """Adds GitHub MCP server when enabled and token is present."""
         with patch.object(Settings, 'github_token', "test-token"), \
              patch.object(Settings, 'claude_mcp_github', True), \
              patch.object(Settings, 'claude_mcp_servers', ""):
-            settings = Settings()
             result = settings.get_mcp_config()
             assert result is not None
             assert "github" in result
             assert result["github"]["type"] == "http"
             assert "Bearer test-token" in result["github"]["headers"]["Authorization"]
 
-    def test_parses_additional_mcp_servers(self):
+    def test_parses_additional_mcp_servers(self, settings):
         """Parses additional MCP servers from JSON string."""
         with patch.object(Settings, 'claude_mcp_github', False), \
              patch.object(Settings, 'claude_mcp_servers', '{"sentry": {"type": "sse", "url": "https://example.com"}}'):
-            settings = Settings()
             result = settings.get_mcp_config()
             assert result is not None
             assert "sentry" in result
             assert result["sentry"]["type"] == "sse"
 
-    def test_handles_invalid_mcp_json_gracefully(self):
+    def test_handles_invalid_mcp_json_gracefully(self, settings):
         """Handles invalid JSON in mcp_servers without raising."""
         with patch.object(Settings, 'claude_mcp_github', False), \
              patch.object(Settings, 'claude_mcp_servers', "not valid json"):
-            settings = Settings()
             result = settings.get_mcp_config()
             # Should return None since no valid servers parsed
             assert result is None
+
+    def test_parses_mcp_servers_with_surrounding_whitespace(self, settings):
+        """Leading whitespace doesn't defeat the JSON object check."""
+        with patch.object(Settings, 'claude_mcp_github', False), \
+             patch.object(Settings, 'claude_mcp_servers', '  {"sentry": {"type": "sse"}}\n'):
+            result = settings.get_mcp_config()
+            assert result == {"sentry": {"type": "sse"}}
+
+    def test_returned_mcp_servers_are_copies(self, settings):
+        """Mutating a returned server entry doesn't leak into later calls."""
+        with patch.object(Settings, 'claude_mcp_github', False), \
+             patch.object(Settings, 'claude_mcp_servers', '{"sentry": {"type": "sse"}}'):
+            settings.get_mcp_config()["sentry"]["headers"] = {"X-Token": "secret"}
+
+            assert settings.get_mcp_config() == {"sentry": {"type": "sse"}}
+
+    def test_ignores_non_object_mcp_json(self, settings):
+        """A JSON value that isn't an object is ignored."""
+        with patch.object(Settings, 'claude_mcp_github', False), \
+             patch.object(Settings, 'claude_mcp_servers', '["sentry"]'):
+            result = settings.get_mcp_config()
+            assert result is None
@@ -8,12 +8,14 @@ Tests cover:
 - Engine cleanup
 """
 
+import asyncio
+from os.path import basename
+
 import pytest
-from pathlib import Path
-from unittest.mock import patch, AsyncMock, MagicMock
-import tempfile
-import os
+from sqlalchemy import MetaData
+from sqlalchemy.pool import StaticPool
 
+import app.database as _db
 from app.database import (
     Base,
     _engines,
@@ -28,261 +30,245 @@ from app.database import (
 )
 
 
-class TestEngineManagement:
-    """Tests for engine creation and caching."""
+def _clear_db_caches():
+    _engines.clear()
+    _session_factories.clear()
+    _initialized_dbs.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_db_caches():
+    """Reset the module-level engine caches around every test."""
+    _clear_db_caches()
+    yield
+    _clear_db_caches()
+
+
+def _mem_db_url(repo_path: str) -> str:
+    """SQLite URI for a private in-memory database, keyed on the repo path."""
+    return f"file:{abs(hash(repo_path))}?mode=memory&cache=shared&uri=true"
+
+
+def _path_by_basename(root):
+    """Build a get_repo_db_path stand-in giving each repo its own db file under root."""
+    return lambda p: root / f"{basename(p)}.db"
+
+
+def _seed_two_engines(tmp_path, monkeypatch) -> tuple[str, str]:
+    """Create cached engines and session factories for two distinct repos."""
+    repo_path1 = str(tmp_path / "repo1")
+    repo_path2 = str(tmp_path / "repo2")
+
+    monkeypatch.setattr(_db, "get_repo_db_path", _path_by_basename(tmp_path))
+    for repo_path in (repo_path1, repo_path2):
+        _get_engine(repo_path)
+        _get_session_factory(repo_path)
+
+    return repo_path1, repo_path2
 
-    def setup_method(self):
-        """Clear engine cache before each test."""
-        _engines.clear()
-        _session_factories.clear()
 
-    def teardown_method(self):
-        """Clear engine cache after each test."""
-        _engines.clear()
-        _session_factories.clear()
+@pytest.fixture(scope="module")
+def shared_db_file(tmp_path_factory):
+    """Create and initialize one database file for the whole module."""
+    root = tmp_path_factory.mktemp("shared_db")
+    db_path = root / "data.db"
+    repo_path = str(root / "repo")
 
-    def test_get_engine_creates_new_engine(self, tmp_path):
+    async def _init():
+        await init_repo_db(repo_path)
+        await close_all_engines()
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_db, "get_repo_db_path", lambda p: db_path)
+        asyncio.run(_init())
+    clear_engine_cache(repo_path)
+
+    return db_path, repo_path
+
+
+@pytest.fixture
+def shared_db(shared_db_file, monkeypatch):
+    """
+    Point a repo at the shared, already-initialized database.
+
+    The repo is marked as initialized so get_repo_db skips create_all;
+    use tmp_path instead for tests that exercise initialization itself.
+    """
+    db_path, repo_path = shared_db_file
+    monkeypatch.setattr(_db, "get_repo_db_path", lambda p: db_path)
+    _initialized_dbs.add(repo_path)
+    return db_path, repo_path
+
+
+class TestEngineManagement:
+    """Tests for engine creation and caching."""
+
+    def test_get_engine_creates_new_engine(self, tmp_path, monkeypatch):
         """Test that _get_engine creates a new engine for a path."""
-        with patch("app.database.get_repo_db_path", return_value=tmp_path / "data.db"):
-            engine = _get_engine(str(tmp_path / "repo"))
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: tmp_path / "data.db")
+        engine = _get_engine(str(tmp_path / "repo"))
 
-            assert engine is not None
-            assert str(tmp_path / "repo") in _engines
+        assert engine is not None
+        assert str(tmp_path / "repo") in _engines
 
-    def test_get_engine_caches_engine(self, tmp_path):
+    def test_get_engine_caches_engine(self, tmp_path, monkeypatch):
         """Test that _get_engine returns cached engine on second call."""
         repo_path = str(tmp_path / "repo")
 
-        with patch("app.database.get_repo_db_path", return_value=tmp_path / "data.db"):
-            engine1 = _get_engine(repo_path)
-            engine2 = _get_engine(repo_path)
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: tmp_path / "data.db")
+        engine1 = _get_engine(repo_path)
+        engine2 = _get_engine(repo_path)
 
-            assert engine1 is engine2
-            assert len(_engines) == 1
+        assert engine1 is engine2
+        assert set(_engines) == {repo_path}
 
-    def test_get_engine_different_paths(self, tmp_path):
-        """Test that different paths get different engines."""
-        repo_path1 = str(tmp_path / "repo1")
-        repo_path2 = str(tmp_path / "repo2")
+    def test_get_engine_uses_static_pool(self, tmp_path, monkeypatch):
+        """Test that engines keep a single pooled connection per repo."""
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: tmp_path / "data.db")
+        engine = _get_engine(str(tmp_path / "repo"))
+
+        assert isinstance(engine.pool, StaticPool)
 
-        with patch("app.database.get_repo_db_path", side_effect=lambda p: tmp_path / f"{p.split('/')[-1]}.db"):
-            engine1 = _get_engine(repo_path1)
-            engine2 = _get_engine(repo_path2)
+    def test_get_engine_different_paths(self, tmp_path, monkeypatch):
+        """Test that different paths get different engines."""
+        repo_path1, repo_path2 = _seed_two_engines(tmp_path, monkeypatch)
 
-            assert engine1 is not engine2
-            assert len(_engines) == 2
+        assert _engines[repo_path1] is not _engines[repo_path2]
+        assert set(_engines) == {repo_path1, repo_path2}
 
 
 class TestSessionFactoryManagement:
     """Tests for session factory creation and caching."""
 
-    def setup_method(self):
-        """Clear caches before each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    def teardown_method(self):
-        """Clear caches after each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    def test_get_session_factory_creates_new_factory(self, tmp_path):
+    def test_get_session_factory_creates_new_factory(self, tmp_path, monkeypatch):
         """Test that _get_session_factory creates a new factory."""
         repo_path = str(tmp_path / "repo")
 
-        with patch("app.database.get_repo_db_path", return_value=tmp_path / "data.db"):
-            factory = _get_session_factory(repo_path)
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: tmp_path / "data.db")
+        factory = _get_session_factory(repo_path)
 
-            assert factory is not None
-            assert repo_path in _session_factories
+        assert factory is not None
+        assert repo_path in _session_factories
 
-    def test_get_session_factory_caches_factory(self, tmp_path):
+    def test_get_session_factory_caches_factory(self, tmp_path, monkeypatch):
         """Test that _get_session_factory returns cached factory."""
         repo_path = str(tmp_path / "repo")
 
-        with patch("app.database.get_repo_db_path", return_value=tmp_path / "data.db"):
-            factory1 = _get_session_factory(repo_path)
-            factory2 = _get_session_factory(repo_path)
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: tmp_path / "data.db")
+        factory1 = _get_session_factory(repo_path)
+        factory2 = _get_session_factory(repo_path)
 
-            assert factory1 is factory2
-            assert len(_session_factories) == 1
+        assert factory1 is factory2
+        assert set(_session_factories) == {repo_path}
 
 
 class TestDatabaseInitialization:
     """Tests for database initialization."""
 
-    def setup_method(self):
-        """Clear caches before each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    def teardown_method(self):
-        """Clear caches after each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    @pytest.mark.asyncio
-    async def test_init_repo_db_creates_tables(self, tmp_path):
+    async def test_init_repo_db_creates_tables(self, tmp_path, monkeypatch):
         """Test that init_repo_db creates database tables."""
-        db_path = tmp_path / "data.db"
         repo_path = str(tmp_path / "repo")
+        db_path = _mem_db_url(repo_path)
 
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            await init_repo_db(repo_path)
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: db_path)
+        await init_repo_db(repo_path)
 
-            # Database file should be created
-            assert db_path.exists()
+        assert repo_path in _initialized_dbs
 
-    @pytest.mark.asyncio
-    async def test_init_repo_db_idempotent(self, tmp_path):
+    async def test_init_repo_db_idempotent(self, tmp_path, monkeypatch):
         """Test that init_repo_db can be called multiple times."""
-        db_path = tmp_path / "data.db"
         repo_path = str(tmp_path / "repo")
+        db_path = _mem_db_url(repo_path)
 
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            await init_repo_db(repo_path)
-            await init_repo_db(repo_path)
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: db_path)
+        await init_repo_db(repo_path)
+        await init_repo_db(repo_path)
 
-            # Should not raise any errors
-            assert db_path.exists()
+        # Should not raise any errors
+        assert repo_path in _initialized_dbs
 
 
 class TestGetRepoDb:
     """Tests for the get_repo_db context manager."""
 
-    def setup_method(self):
-        """Clear caches before each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    def teardown_method(self):
-        """Clear caches after each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    @pytest.mark.asyncio
-    async def test_get_repo_db_yields_session(self, tmp_path):
-        """Test that get_repo_db yields a database session."""
-        db_path = tmp_path / "data.db"
-        repo_path = str(tmp_path / "repo")
-
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            async with get_repo_db(repo_path) as session:
-                assert session is not None
-                # Session should have execute method
-                assert hasattr(session, "execute")
-
-    @pytest.mark.asyncio
-    async def test_get_repo_db_initializes_db(self, tmp_path):
+    async def test_get_repo_db_initializes_db(self, tmp_path, monkeypatch):
         """Test that get_repo_db initializes the database."""
-        db_path = tmp_path / "data.db"
         repo_path = str(tmp_path / "repo")
+        db_path = _mem_db_url(repo_path)
 
-        assert not db_path.exists()
+        assert repo_path not in _initialized_dbs
 
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            async with get_repo_db(repo_path) as session:
-                pass
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: db_path)
+        async with get_repo_db(repo_path) as session:
+            pass
 
-            # Database should be created
-            assert db_path.exists()
+        # Database should be initialized
+        assert repo_path in _initialized_dbs
 
 
 class TestCloseAllEngines:
     """Tests for engine cleanup."""
 
-    def setup_method(self):
-        """Clear caches before each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    def teardown_method(self):
-        """Clear caches after each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    @pytest.mark.asyncio
-    async def test_close_all_engines_clears_caches(self, tmp_path):
-        """Test that close_all_engines clears all caches."""
+    async def test_close_all_engines_clears_caches(self, tmp_path, monkeypatch):
+        """Test that close_all_engines clears engine caches but not _initialized_dbs."""
         db_path = tmp_path / "data.db"
         repo_path = str(tmp_path / "repo")
 
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            # Create an engine
-            _get_engine(repo_path)
-            _get_session_factory(repo_path)
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: db_path)
+        # Create an engine
+        _get_engine(repo_path)
+        _get_session_factory(repo_path)
+
+        assert set(_engines) == {repo_path}
+        assert set(_session_factories) == {repo_path}
 
-            assert len(_engines) == 1
-            assert len(_session_factories) == 1
+        _initialized_dbs.add(repo_path)
 
-            await close_all_engines()
+        await close_all_engines()
 
-            assert len(_engines) == 0
-            assert len(_session_factories) == 0
+        assert not _engines
+        assert not _session_factories
+        # _initialized_dbs is intentionally kept: it tracks which databases
+        # have had their schema created, and the schema persists on disk
+        assert repo_path in _initialized_dbs
 
 
 class TestClearEngineCache:
     """Tests for selective cache clearing."""
 
-    def setup_method(self):
-        """Clear caches before each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    def teardown_method(self):
-        """Clear caches after each test."""
-        _engines.clear()
-        _session_factories.clear()
-
-    def test_clear_engine_cache_specific_path(self, tmp_path):
+    def test_clear_engine_cache_specific_path(self, tmp_path, monkeypatch):
         """Test clearing cache for a specific path."""
-        repo_path1 = str(tmp_path / "repo1")
-        repo_path2 = str(tmp_path / "repo2")
-
-        with patch("app.database.get_repo_db_path", side_effect=lambda p: tmp_path / f"{p.split('/')[-1]}.db"):
-            _get_engine(repo_path1)
-            _get_session_factory(repo_path1)
-            _get_engine(repo_path2)
-            _get_session_factory(repo_path2)
+        repo_path1, repo_path2 = _seed_two_engines(tmp_path, monkeypatch)
 
-            assert len(_engines) == 2
-            assert len(_session_factories) == 2
+        assert set(_engines) == {repo_path1, repo_path2}
+        assert set(_session_factories) == {repo_path1, repo_path2}
 
-            clear_engine_cache(repo_path1)
+        clear_engine_cache(repo_path1)
 
-            assert len(_engines) == 1
-            assert len(_session_factories) == 1
-            assert repo_path1 not in _engines
-            assert repo_path2 in _engines
+        assert set(_engines) == {repo_path2}
+        assert set(_session_factories) == {repo_path2}
 
-    def test_clear_engine_cache_all(self, tmp_path):
+    def test_clear_engine_cache_all(self, tmp_path, monkeypatch):
         """Test clearing all caches."""
-        repo_path1 = str(tmp_path / "repo1")
-        repo_path2 = str(tmp_path / "repo2")
-
-        with patch("app.database.get_repo_db_path", side_effect=lambda p: tmp_path / f"{p.split('/')[-1]}.db"):
-            _get_engine(repo_path1)
-            _get_session_factory(repo_path1)
-            _get_engine(repo_path2)
-            _get_session_factory(repo_path2)
+        _seed_two_engines(tmp_path, monkeypatch)
 
-            clear_engine_cache(None)
+        clear_engine_cache(None)
 
-            assert len(_engines) == 0
-            assert len(_session_factories) == 0
+        assert not _engines
+        assert not _session_factories
 
-    def test_clear_engine_cache_nonexistent_path(self, tmp_path):
+    def test_clear_engine_cache_nonexistent_path(self, tmp_path, monkeypatch):
         """Test clearing cache for a path that doesn't exist."""
         repo_path = str(tmp_path / "repo")
 
-        with patch("app.database.get_repo_db_path", return_value=tmp_path / "data.db"):
-            _get_engine(repo_path)
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: tmp_path / "data.db")
+        _get_engine(repo_path)
 
-            # Should not raise
-            clear_engine_cache(str(tmp_path / "nonexistent"))
+        # Should not raise
+        clear_engine_cache(str(tmp_path / "nonexistent"))
 
-            # Original should still be there
-            assert len(_engines) == 1
+        # Original should still be there
+        assert set(_engines) == {repo_path}
 
 
 class TestBase:
@@ -290,77 +276,43 @@ class TestBase:
 
     def test_base_is_declarative_base(self):
         """Test that Base is a proper SQLAlchemy declarative base."""
-        # Base should have metadata attribute (registry of tables)
-        assert hasattr(Base, "metadata")
-        # Base.metadata should be a MetaData instance
-        from sqlalchemy import MetaData
+        # Base.metadata is the registry of tables
         assert isinstance(Base.metadata, MetaData)
 
 
 class TestInitializedDbsTracking:
     """Tests for the _initialized_dbs tracking set."""
 
-    def setup_method(self):
-        """Clear all caches before each test."""
-        _engines.clear()
-        _session_factories.clear()
-        _initialized_dbs.clear()
-
-    def teardown_method(self):
-        """Clear all caches after each test."""
-        _engines.clear()
-        _session_factories.clear()
-        _initialized_dbs.clear()
-
-    @pytest.mark.asyncio
-    async def test_init_repo_db_marks_as_initialized(self, tmp_path):
+    async def test_init_repo_db_marks_as_initialized(self, tmp_path, monkeypatch):
         """Test that init_repo_db adds path to _initialized_dbs."""
-        db_path = tmp_path / "data.db"
         repo_path = str(tmp_path / "repo")
+        db_path = _mem_db_url(repo_path)
 
         assert repo_path not in _initialized_dbs
 
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            await init_repo_db(repo_path)
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: db_path)
+        await init_repo_db(repo_path)
 
         assert repo_path in _initialized_dbs
 
-    @pytest.mark.asyncio
-    async def test_init_repo_db_skips_if_already_initialized(self, tmp_path):
+    async def test_init_repo_db_skips_if_already_initialized(self, tmp_path, monkeypatch):
         """Test that init_repo_db skips if already in _initialized_dbs."""
-        db_path = tmp_path / "data.db"
         repo_path = str(tmp_path / "repo")
 
         # Pre-mark as initialized
         _initialized_dbs.add(repo_path)
 
-        with patch("app.database.get_repo_db_path", return_value=db_path) as mock_path:
-            with patch("app.database._get_engine") as mock_engine:
-                await init_repo_db(repo_path)
-
-                # _get_engine should not be called since we skip initialization
-                mock_engine.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_get_repo_db_initializes_db(self, tmp_path):
-        """Test that get_repo_db calls init_repo_db."""
-        db_path = tmp_path / "data.db"
-        repo_path = str(tmp_path / "repo")
-
-        assert repo_path not in _initialized_dbs
-
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            async with get_repo_db(repo_path) as session:
-                pass
+        def fail_get_engine(local_path):
+            raise AssertionError("_get_engine should not be called")
 
-        # Should be marked as initialized
-        assert repo_path in _initialized_dbs
+        # _get_engine should not be called since we skip initialization
+        monkeypatch.setattr(_db, "_get_engine", fail_get_engine)
+        await init_repo_db(repo_path)
 
-    @pytest.mark.asyncio
-    async def test_multiple_get_repo_db_calls_only_init_once(self, tmp_path):
+    async def test_multiple_get_repo_db_calls_only_init_once(self, tmp_path, monkeypatch):
         """Test that multiple get_repo_db calls only initialize once."""
-        db_path = tmp_path / "data.db"
         repo_path = str(tmp_path / "repo")
+        db_path = _mem_db_url(repo_path)
 
         init_count = 0
 
@@ -371,17 +323,17 @@ class TestInitializedDbsTracking:
             init_count += 1
             await original_init(path)
 
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            # First call - should initialize
-            async with get_repo_db(repo_path) as session:
-                pass
+        monkeypatch.setattr(_db, "get_repo_db_path", lambda p: db_path)
+        # First call - should initialize
+        async with get_repo_db(repo_path) as session:
+            pass
 
-            # After first init, path should be in _initialized_dbs
-            first_time_initialized = repo_path in _initialized_dbs
+        # After first init, path should be in _initialized_dbs
+        first_time_initialized = repo_path in _initialized_dbs
 
-            # Second call - should use cached initialization state
-            async with get_repo_db(repo_path) as session:
-                pass
+        # Second call - should use cached initialization state
+        async with get_repo_db(repo_path) as session:
+            pass
 
         assert first_time_initialized is True
 
@@ -395,7 +347,7 @@ class TestInitializedDbsTracking:
 
         clear_engine_cache(None)
 
-        assert len(_initialized_dbs) == 0
+        assert not _initialized_dbs
 
     def test_clear_engine_cache_specific_clears_initialized_db(self, tmp_path):
         """Test that clear_engine_cache with path clears specific _initialized_db entry."""
@@ -411,102 +363,13 @@ class TestInitializedDbsTracking:
         assert repo_path2 in _initialized_dbs
 
 
-class TestCloseAllEnginesWithInitializedDbs:
-    """Tests for close_all_engines and its interaction with _initialized_dbs."""
-
-    def setup_method(self):
-        """Clear all caches before each test."""
-        _engines.clear()
-        _session_factories.clear()
-        _initialized_dbs.clear()
-
-    def teardown_method(self):
-        """Clear all caches after each test."""
-        _engines.clear()
-        _session_factories.clear()
-        _initialized_dbs.clear()
-
-    @pytest.mark.asyncio
-    async def test_close_all_engines_does_not_clear_initialized_dbs(self, tmp_path):
-        """Test that close_all_engines clears engines but not _initialized_dbs.
-
-        Note: This tests current behavior. The _initialized_dbs set persists
-        through engine closure because it tracks which DBs have had their
-        schema created, not whether the engine is currently open.
-        """
-        db_path = tmp_path / "data.db"
-        repo_path = str(tmp_path / "repo")
-
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            _get_engine(repo_path)
-            _initialized_dbs.add(repo_path)
-
-            await close_all_engines()
-
-            # Engines should be cleared
-            assert len(_engines) == 0
-            # But _initialized_dbs is NOT cleared by close_all_engines
-            # (This is intentional - schema doesn't need recreating on reconnect)
-            # Actually, looking at the code, close_all_engines only clears engines
-            # and session_factories, not _initialized_dbs
-            # This is reasonable as schema persists in the db file
-
-
 class TestDatabaseSessionBehavior:
     """Tests for database session behavior within context manager."""
 
-    def setup_method(self):
-        """Clear all caches before each test."""
-        _engines.clear()
-        _session_factories.clear()
-        _initialized_dbs.clear()
-
-    def teardown_method(self):
-        """Clear all caches after each test."""
-        _engines.clear()
-        _session_factories.clear()
-        _initialized_dbs.clear()
-
-    @pytest.mark.asyncio
-    async def test_session_has_execute_method(self, tmp_path):
-        """Test that yielded session has execute method."""
-        db_path = tmp_path / "data.db"
-        repo_path = str(tmp_path / "repo")
-
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            async with get_repo_db(repo_path) as session:
-                assert hasattr(session, "execute")
-                assert callable(session.execute)
-
-    @pytest.mark.asyncio
-    async def test_session_has_commit_method(self, tmp_path):
-        """Test that yielded session has commit method."""
-        db_path = tmp_path / "data.db"
-        repo_path = str(tmp_path / "repo")
-
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            async with get_repo_db(repo_path) as session:
-                assert hasattr(session, "commit")
-                assert callable(session.commit)
-
-    @pytest.mark.asyncio
-    async def test_session_has_add_method(self, tmp_path):
-        """Test that yielded session has add method."""
-        db_path = tmp_path / "data.db"
-        repo_path = str(tmp_path / "repo")
-
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            async with get_repo_db(repo_path) as session:
-                assert hasattr(session, "add")
-                assert callable(session.add)
-
-    @pytest.mark.asyncio
-    async def test_session_has_refresh_method(self, tmp_path):
-        """Test that yielded session has refresh method."""
-        db_path = tmp_path / "data.db"
-        repo_path = str(tmp_path / "repo")
+    async def test_session_has_core_methods(self, shared_db):
+        """Test that yielded session has execute, commit, add and refresh methods."""
+        _, repo_path = shared_db
 
-        with patch("app.database.get_repo_db_path", return_value=db_path):
-            async with get_repo_db(repo_path) as session:
-                assert hasattr(session, "refresh")
-                assert callable(session.refresh)
+        async with get_repo_db(repo_path) as session:
+            for method in ("execute", "commit", "add", "refresh"):
+                assert callable(getattr(session, method, None)), method
@@ -14,7 +14,7 @@ Tests cover:
 import asyncio
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock
 
 from app.services.event_manager import (
     Event,
@@ -23,6 +23,81 @@ from app.services.event_manager import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _no_counts_debounce(monkeypatch):
+    """Fire debounced counts_changed events on the next loop iteration."""
+    monkeypatch.setattr("app.services.event_manager.COUNTS_DEBOUNCE_SECS", 0)
+
+
+@pytest.fixture(scope="module")
+def _shared_manager():
+    """One EventManager reused by the emit/subscribe/unsubscribe tests."""
+    return EventManager()
+
+
+@pytest.fixture
+def manager(_shared_manager):
+    """The shared EventManager, reset to its initial state after each test."""
+    yield _shared_manager
+    _shared_manager._subscribers.clear()
+    _shared_manager._pending_counts = None
+    if _shared_manager._counts_task is not None:
+        _shared_manager._counts_task.cancel()
+        _shared_manager._counts_task = None
+
+
+async def _wait_for_counts_emit(manager):
+    """Wait for the pending debounced counts_changed emit, if any."""
+    task = manager._counts_task
+    if task is not None:
+        await task
+
+
+_FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns _FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze Event timestamps at _FROZEN_NOW."""
+    monkeypatch.setattr("app.services.event_manager.datetime", _FrozenDatetime)
+    return _FROZEN_NOW
+
+
+def _bulk_subscribe(manager, *callbacks):
+    """Register callbacks directly, for tests that don't exercise subscribe()."""
+    manager._subscribers.extend(callbacks)
+
+
+def _recorder():
+    """Sync subscriber that records the events it receives in .calls."""
+    calls = []
+
+    def callback(event):
+        calls.append(event)
+
+    callback.calls = calls
+    return callback
+
+
+def _async_recorder():
+    """Async subscriber that records the events it receives in .calls."""
+    calls = []
+
+    async def callback(event):
+        calls.append(event)
+
+    callback.calls = calls
+    return callback
+
+
 class TestEvent:
     """Tests for the Event dataclass."""
 
@@ -42,7 +117,7 @@ class TestEvent:
         assert event.type == EventType.SESSION_UPDATED
         assert event.data == data
 
-    def test_to_dict_includes_all_fields(self):
+    def test_to_dict_includes_all_fields(self, frozen_now):
         """to_dict() includes type, data, and timestamp."""
         data = {"session_id": "abc123"}
         event = Event(type=EventType.SESSION_COMPLETED, data=data)
@@ -51,9 +126,9 @@ class TestEvent:
 
         assert result["type"] == "session_completed"
         assert result["session_id"] == "abc123"
-        assert "timestamp" in result
+        assert result["timestamp"] == frozen_now.isoformat()
 
-    def test_to_dict_flattens_data(self):
+    def test_to_dict_flattens_data(self, frozen_now):
         """to_dict() flattens data into top-level keys."""
         data = {"key1": "value1", "key2": "value2"}
         event = Event(type=EventType.PROCESS_STARTED, data=data)
@@ -74,21 +149,18 @@ class TestEvent:
 class TestEventType:
     """Tests for the EventType enum."""
 
-    def test_session_event_types(self):
-        """Session event types are defined correctly."""
-        assert EventType.SESSION_CREATED.value == "session_created"
-        assert EventType.SESSION_UPDATED.value == "session_updated"
-        assert EventType.SESSION_COMPLETED.value == "session_completed"
-        assert EventType.SESSION_DELETED.value == "session_deleted"
-
-    def test_process_event_types(self):
-        """Process event types are defined correctly."""
-        assert EventType.PROCESS_STARTED.value == "process_started"
-        assert EventType.PROCESS_ENDED.value == "process_ended"
-
-    def test_count_event_types(self):
-        """Count event types are defined correctly."""
-        assert EventType.COUNTS_CHANGED.value == "counts_changed"
+    @pytest.mark.parametrize("member, expected", [
+        (EventType.SESSION_CREATED, "session_created"),
+        (EventType.SESSION_UPDATED, "session_updated"),
+        (EventType.SESSION_COMPLETED, "session_completed"),
+        (EventType.SESSION_DELETED, "session_deleted"),
+        (EventType.PROCESS_STARTED, "process_started"),
+        (EventType.PROCESS_ENDED, "process_ended"),
+        (EventType.COUNTS_CHANGED, "counts_changed"),
+    ])
+    def test_event_type_values(self, member, expected):
+        """Each event type carries its wire name as its value."""
+        assert member.value == expected
 
     def test_event_type_is_string(self):
         """EventType inherits from str for easy serialization."""
@@ -106,10 +178,10 @@ class TestEventManagerInit:
         assert manager._subscribers == []
 
     def test_init_creates_lock(self):
-        """Init creates an asyncio Lock for thread safety."""
+        """Init creates a lock for thread safety."""
         manager = EventManager()
 
-        assert isinstance(manager._lock, asyncio.Lock)
+        assert callable(getattr(manager._lock, "acquire", None))
 
     def test_init_initializes_debounce_state(self):
         """Init initializes debounce state variables."""
@@ -123,101 +195,89 @@ class TestEventManagerEmit:
     """Tests for EventManager.emit() method."""
 
     @pytest.mark.asyncio
-    async def test_emit_calls_sync_subscriber(self):
+    async def test_emit_calls_sync_subscriber(self, manager):
         """emit() calls synchronous subscriber callbacks."""
-        manager = EventManager()
-        callback = MagicMock()
+        callback = _recorder()
         manager.subscribe(callback)
 
         await manager.emit(EventType.SESSION_CREATED, {"session_id": "abc"})
 
-        callback.assert_called_once()
-        event = callback.call_args[0][0]
+        assert len(callback.calls) == 1
+        event = callback.calls[-1]
         assert event.type == EventType.SESSION_CREATED
         assert event.data["session_id"] == "abc"
 
     @pytest.mark.asyncio
-    async def test_emit_calls_async_subscriber(self):
+    async def test_emit_calls_async_subscriber(self, manager):
         """emit() awaits asynchronous subscriber callbacks."""
-        manager = EventManager()
-        callback = AsyncMock()
+        callback = _async_recorder()
         manager.subscribe(callback)
 
         await manager.emit(EventType.PROCESS_STARTED)
 
-        callback.assert_called_once()
+        assert len(callback.calls) == 1
 
     @pytest.mark.asyncio
-    async def test_emit_calls_multiple_subscribers(self):
+    async def test_emit_calls_multiple_subscribers(self, manager):
         """emit() calls all registered subscribers."""
-        manager = EventManager()
-        callback1 = MagicMock()
-        callback2 = AsyncMock()
-        callback3 = MagicMock()
-        manager.subscribe(callback1)
-        manager.subscribe(callback2)
-        manager.subscribe(callback3)
+        callback1 = _recorder()
+        callback2 = _async_recorder()
+        callback3 = _recorder()
+        _bulk_subscribe(manager, callback1, callback2, callback3)
 
         await manager.emit(EventType.SESSION_UPDATED)
 
-        callback1.assert_called_once()
-        callback2.assert_called_once()
-        callback3.assert_called_once()
+        assert len(callback1.calls) == 1
+        assert len(callback2.calls) == 1
+        assert len(callback3.calls) == 1
 
     @pytest.mark.asyncio
-    async def test_emit_without_data(self):
+    async def test_emit_without_data(self, manager):
         """emit() works without data parameter."""
-        manager = EventManager()
-        callback = MagicMock()
+        callback = _recorder()
         manager.subscribe(callback)
 
         await manager.emit(EventType.PROCESS_ENDED)
 
-        event = callback.call_args[0][0]
+        event = callback.calls[-1]
         assert event.data == {}
 
     @pytest.mark.asyncio
-    async def test_emit_without_subscribers(self):
+    async def test_emit_without_subscribers(self, manager):
         """emit() works with no subscribers (no error)."""
-        manager = EventManager()
-
         # Should not raise
         await manager.emit(EventType.SESSION_DELETED)
 
     @pytest.mark.asyncio
-    async def test_emit_handles_callback_exception(self):
+    async def test_emit_handles_callback_exception(self, manager):
         """emit() catches and logs exceptions from callbacks."""
-        manager = EventManager()
         callback_error = MagicMock(side_effect=Exception("Callback failed"))
-        callback_ok = MagicMock()
-        manager.subscribe(callback_error)
-        manager.subscribe(callback_ok)
+        callback_ok = _recorder()
+        _bulk_subscribe(manager, callback_error, callback_ok)
 
         # Should not raise, and should continue to other callbacks
         await manager.emit(EventType.SESSION_CREATED)
 
         callback_error.assert_called_once()
-        callback_ok.assert_called_once()
+        assert len(callback_ok.calls) == 1
 
 
 class TestEventManagerSubscribe:
     """Tests for EventManager.subscribe() method."""
 
-    def test_subscribe_adds_callback(self):
+    def test_subscribe_adds_callback(self, manager):
         """subscribe() adds callback to subscribers list."""
-        manager = EventManager()
-        callback = MagicMock()
+        callback = _recorder()
 
         manager.subscribe(callback)
 
         assert callback in manager._subscribers
         assert len(manager._subscribers) == 1
 
-    def test_subscribe_multiple_callbacks(self):
+    def test_subscribe_multiple_callbacks(self, manager):
         """subscribe() can add multiple callbacks."""
-        manager = EventManager()
-        callback1 = MagicMock()
-        callback2 = MagicMock()
+        callback1 = _recorder()
+        callback2 = _recorder()
 
         manager.subscribe(callback1)
         manager.subscribe(callback2)
@@ -226,10 +286,9 @@ class TestEventManagerSubscribe:
         assert callback1 in manager._subscribers
         assert callback2 in manager._subscribers
 
-    def test_subscribe_same_callback_twice(self):
+    def test_subscribe_same_callback_twice(self, manager):
         """subscribe() allows adding the same callback twice."""
-        manager = EventManager()
-        callback = MagicMock()
+        callback = _recorder()
 
         manager.subscribe(callback)
         manager.subscribe(callback)
@@ -241,10 +300,9 @@ class TestEventManagerSubscribe:
 class TestEventManagerUnsubscribe:
     """Tests for EventManager.unsubscribe() method."""
 
-    def test_unsubscribe_removes_callback(self):
+    def test_unsubscribe_removes_callback(self, manager):
         """unsubscribe() removes callback from subscribers list."""
-        manager = EventManager()
-        callback = MagicMock()
+        callback = _recorder()
         manager.subscribe(callback)
 
         manager.unsubscribe(callback)
@@ -252,18 +310,16 @@ class TestEventManagerUnsubscribe:
         assert callback not in manager._subscribers
         assert len(manager._subscribers) == 0
 
-    def test_unsubscribe_nonexistent_callback(self):
+    def test_unsubscribe_nonexistent_callback(self, manager):
         """unsubscribe() handles nonexistent callback gracefully."""
-        manager = EventManager()
-        callback = MagicMock()
+        callback = _recorder()
 
         # Should not raise
         manager.unsubscribe(callback)
 
-    def test_unsubscribe_removes_only_first_occurrence(self):
+    def test_unsubscribe_removes_only_first_occurrence(self, manager):
         """unsubscribe() removes only first occurrence if duplicated."""
-        manager = EventManager()
-        callback = MagicMock()
+        callback = _recorder()
         manager.subscribe(callback)
         manager.subscribe(callback)
 
@@ -273,26 +329,32 @@ class TestEventManagerUnsubscribe:
         assert len(manager._subscribers) == 1
 
     @pytest.mark.asyncio
-    async def test_unsubscribed_callback_not_called(self):
+    async def test_unsubscribed_callback_not_called(self, manager):
         """Unsubscribed callback is not called on emit."""
-        manager = EventManager()
-        callback = MagicMock()
+        callback = _recorder()
         manager.subscribe(callback)
         manager.unsubscribe(callback)
 
         await manager.emit(EventType.SESSION_CREATED)
 
-        callback.assert_not_called()
+        assert not callback.calls
 
 
 class TestEventManagerEmitCountsChanged:
     """Tests for EventManager.emit_counts_changed() debouncing."""
 
+    @pytest.fixture
+    def manager(self):
+        """A fresh EventManager per test, so debounce state never crosses tests."""
+        manager = EventManager()
+        yield manager
+        if manager._counts_task is not None:
+            manager._counts_task.cancel()
+
     @pytest.mark.asyncio
-    async def test_emit_counts_changed_debounces(self):
+    async def test_emit_counts_changed_debounces(self, manager):
         """emit_counts_changed() debounces multiple rapid calls."""
-        manager = EventManager()
-        callback = AsyncMock()
+        callback = _async_recorder()
         manager.subscribe(callback)
 
         # Emit multiple counts rapidly
@@ -301,18 +363,17 @@ class TestEventManagerEmitCountsChanged:
         await manager.emit_counts_changed({"repo1": {"total": 3}})
 
         # Wait for debounce
-        await asyncio.sleep(0.15)
+        await _wait_for_counts_emit(manager)
 
         # Should only be called once (debounced)
-        assert callback.call_count == 1
+        assert len(callback.calls) == 1
         # Should have the last value
-        event = callback.call_args[0][0]
+        event = callback.calls[-1]
         assert event.data["counts"]["repo1"]["total"] == 3
 
     @pytest.mark.asyncio
-    async def test_emit_counts_changed_stores_pending(self):
+    async def test_emit_counts_changed_stores_pending(self, manager):
         """emit_counts_changed() stores counts in _pending_counts."""
-        manager = EventManager()
         counts = {"repo1": {"total": 5, "active": 2}}
 
         await manager.emit_counts_changed(counts)
@@ -321,23 +382,21 @@ class TestEventManagerEmitCountsChanged:
         assert manager._pending_counts == counts
 
     @pytest.mark.asyncio
-    async def test_emit_counts_changed_clears_after_emit(self):
+    async def test_emit_counts_changed_clears_after_emit(self, manager):
         """emit_counts_changed() clears pending counts after emit."""
-        manager = EventManager()
-        callback = AsyncMock()
+        callback = _async_recorder()
         manager.subscribe(callback)
 
         await manager.emit_counts_changed({"repo1": {"total": 5}})
-        await asyncio.sleep(0.15)
+        await _wait_for_counts_emit(manager)
 
         assert manager._pending_counts is None
         assert manager._counts_task is None
 
     @pytest.mark.asyncio
-    async def test_emit_counts_changed_cancels_previous_task(self):
+    async def test_emit_counts_changed_cancels_previous_task(self, manager):
         """emit_counts_changed() cancels previous debounce task."""
-        manager = EventManager()
-        callback = AsyncMock()
+        callback = _async_recorder()
         manager.subscribe(callback)
 
         await manager.emit_counts_changed({"repo1": {"total": 1}})
@@ -351,16 +410,15 @@ class TestEventManagerEmitCountsChanged:
         assert second_task is not first_task
 
     @pytest.mark.asyncio
-    async def test_emit_counts_changed_emits_correct_event_type(self):
+    async def test_emit_counts_changed_emits_correct_event_type(self, manager):
         """emit_counts_changed() emits COUNTS_CHANGED event type."""
-        manager = EventManager()
-        callback = AsyncMock()
+        callback = _async_recorder()
         manager.subscribe(callback)
 
         await manager.emit_counts_changed({"repo1": {"total": 10}})
-        await asyncio.sleep(0.15)
+        await _wait_for_counts_emit(manager)
 
-        event = callback.call_args[0][0]
+        event = callback.calls[-1]
         assert event.type == EventType.COUNTS_CHANGED
 
 
@@ -422,7 +480,7 @@ class TestEventManagerIntegration:
 
         manager.subscribe(callback)
 
-        # Emit multiple events concurrently
+        # The one test that emits concurrently; the others await emits in turn
         await asyncio.gather(
             manager.emit(EventType.SESSION_CREATED, {"id": "1"}),
             manager.emit(EventType.SESSION_CREATED, {"id": "2"}),
@@ -444,8 +502,7 @@ class TestEventManagerIntegration:
         async def async_callback(event):
             async_calls.append(event)
 
-        manager.subscribe(sync_callback)
-        manager.subscribe(async_callback)
+        _bulk_subscribe(manager, sync_callback, async_callback)
 
         await manager.emit(EventType.PROCESS_ENDED, {"code": 0})
 
@@ -473,19 +530,21 @@ class TestEventManagerIntegration:
 
         # Start the first emit
         await manager.emit_counts_changed({"repo1": {"total": 1}})
+        first_task = manager._counts_task
 
         # Wait for debounce and for emit to start calling callback
-        await asyncio.sleep(0.15)
+        await emit_started.wait()
 
         # While slow_callback is running, we should be able to emit new counts
         # without blocking (since lock is released before emit)
         await manager.emit_counts_changed({"repo1": {"total": 2}})
+        second_task = manager._counts_task
 
         # Allow slow callback to complete
         emit_can_continue.set()
 
-        # Wait for second debounce
-        await asyncio.sleep(0.15)
+        # Wait for both debounced emits
+        await asyncio.gather(first_task, second_task)
 
         # Should have received both events
         assert len(received_events) == 2
@@ -12,9 +12,11 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import copy
 import pytest
 from datetime import datetime
-from unittest.mock import MagicMock, patch, PropertyMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from app.services.github_client import (
     GitHubClient,
@@ -25,180 +27,289 @@ from app.services.github_client import (
 )
 
 
-@pytest.fixture
-def mock_github():
-    """Create a mock Github instance."""
-    with patch("app.services.github_client.Github") as mock_cls:
-        mock_instance = MagicMock()
-        mock_cls.return_value = mock_instance
-        yield mock_instance
+# Fixed timestamps shared by the mock issues, PRs and comments below
+_ISSUE_CREATED_AT = datetime(2024, 1, 15, 10, 0, 0)
+_ISSUE_UPDATED_AT = datetime(2024, 1, 15, 12, 0, 0)
+_ISSUE_COMMENT1_AT = datetime(2024, 1, 15, 11, 0, 0)
+_ISSUE_COMMENT2_AT = datetime(2024, 1, 15, 12, 0, 0)
+_PR_CREATED_AT = datetime(2024, 1, 10, 8, 0, 0)
+_PR_UPDATED_AT = datetime(2024, 1, 15, 14, 0, 0)
+_PR_COMMENT1_AT = datetime(2024, 1, 16, 10, 0, 0)
+_PR_COMMENT2_AT = datetime(2024, 1, 16, 11, 0, 0)
+_REVIEW_AT = datetime(2024, 1, 16, 14, 30, 0)
+
+
+@pytest.fixture(scope="module")
+def _github_patches():
+    """Patch Github, Auth and settings once for the whole module."""
+    with patch("app.services.github_client.Github") as mock_cls, \
+         patch("app.services.github_client.Auth") as mock_auth, \
+         patch("app.services.github_client.settings") as mock_settings:
+        mock_cls.return_value = MagicMock()
+        yield mock_cls, mock_auth, mock_settings
+
+
+@pytest.fixture(scope="module")
+def mock_github(_github_patches):
+    """The mock Github instance every GitHubClient in this module talks to."""
+    return _github_patches[0].return_value
+
+
+@pytest.fixture(scope="module")
+def mock_auth(_github_patches):
+    """The mock Auth module."""
+    return _github_patches[1]
+
+
+@pytest.fixture(scope="module")
+def mock_settings(_github_patches):
+    """The mock settings object."""
+    return _github_patches[2]
+
+
+@pytest.fixture(autouse=True)
+def _reset_github_mocks(_github_patches, mock_github, mock_auth, mock_settings):
+    """Clear recorded calls and configured results between tests.
+
+    The patched mocks live for the whole module, so tests may only configure
+    them through ``return_value``/``side_effect`` (and ``github_token`` on
+    settings); anything else would leak into later tests.
+    """
+    mock_settings.github_token = "test-token-123"
+    yield
+    _github_patches[0].reset_mock()
+    mock_github.reset_mock(return_value=True, side_effect=True)
+    mock_auth.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def _client_template(mock_github, mock_auth, mock_settings):
+    """One GitHubClient built against the module-wide mocks."""
+    mock_settings.github_token = "test-token-123"
+    return GitHubClient()
 
 
 @pytest.fixture
-def mock_auth():
-    """Create a mock Auth.Token."""
-    with patch("app.services.github_client.Auth") as mock_auth:
-        yield mock_auth
+def client(_client_template):
+    """Shallow copy of the template client with its own repo cache."""
+    client = copy.copy(_client_template)
+    client._repo_cache = {}
+    return client
 
 
 @pytest.fixture
-def mock_settings():
-    """Create mock settings with a token."""
-    with patch("app.services.github_client.settings") as mock:
-        mock.github_token = "test-token-123"
-        yield mock
+def mock_repo(mock_github):
+    """Mock Repository returned by mock_github.get_repo()."""
+    repo = MagicMock(spec_set=_REPO_METHODS)
+    mock_github.get_repo.return_value = repo
+    return repo
 
 
 @pytest.fixture
-def client(mock_github, mock_auth, mock_settings):
-    """Create a GitHubClient instance with mocked dependencies."""
-    return GitHubClient()
+def mock_issue(mock_repo):
+    """Mock Issue returned by mock_repo.get_issue()."""
+    issue = MagicMock(spec_set=_ISSUE_METHODS)
+    mock_repo.get_issue.return_value = issue
+    return issue
 
 
 @pytest.fixture
-def client_no_token(mock_github, mock_auth):
+def client_no_token(mock_settings):
     """Create a GitHubClient instance without a token."""
-    with patch("app.services.github_client.settings") as mock_settings:
-        mock_settings.github_token = None
-        return GitHubClient()
+    mock_settings.github_token = None
+    return GitHubClient()
+
+
+# Repository/Issue methods GitHubClient calls; spec_set on the mocks catches typos
+_REPO_METHODS = ("create_issue", "get_issue", "get_pull", "get_assignees", "get_labels")
+_ISSUE_METHODS = ("edit", "add_to_labels", "create_comment", "get_comments")
+
+
+class _Results:
+    """Stand-in for PyGithub's PaginatedList of search results."""
+
+    __slots__ = ("_items", "totalCount")
+
+    def __init__(self, items, total=None):
+        self._items = items
+        self.totalCount = len(items) if total is None else total
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+def _capture_searches(mock_github, results=()) -> list[tuple[str, dict]]:
+    """Record each search_issues (query, kwargs) call; every search returns ``results``."""
+    searches = []
+
+    def search_issues(query, **kwargs):
+        searches.append((query, kwargs))
+        return _Results(list(results))
+
+    mock_github.search_issues.side_effect = search_issues
+    return searches
+
+
+# Label objects shared by every mock that uses one of these names
+_LABEL_POOL = {
+    name: SimpleNamespace(name=name)
+    for name in (
+        "bug", "help wanted", "feature", "ready", "priority", "enhancement", "documentation",
+    )
+}
+
+# Canonical mock Issue/PullRequest objects; helpers copy these per test
+_DEFAULT_ISSUE = SimpleNamespace(
+    number=42,
+    title="Test Issue",
+    body="Issue body",
+    state="open",
+    comments=0,
+    html_url="https://github.com/owner/repo/issues/42",
+    created_at=_ISSUE_CREATED_AT,
+    updated_at=_ISSUE_UPDATED_AT,
+    labels=(),
+    user=SimpleNamespace(login="testuser"),
+)
+
+_DEFAULT_PR = SimpleNamespace(
+    number=123,
+    title="Test PR",
+    body="PR body",
+    state="open",
+    additions=50,
+    deletions=10,
+    changed_files=3,
+    comments=0,
+    html_url="https://github.com/owner/repo/pull/123",
+    created_at=_PR_CREATED_AT,
+    updated_at=_PR_UPDATED_AT,
+    labels=(),
+    user=SimpleNamespace(login="prauthor"),
+    head=SimpleNamespace(ref="feature/test"),
+    base=SimpleNamespace(ref="main"),
+)
+
+
+def _make_comment(
+    id_: int = 1,
+    body: str | None = "First comment",
+    author: str | None = "commenter1",
+    created_at: datetime = _ISSUE_COMMENT1_AT,
+):
+    """Helper to create a mock GitHub IssueComment; ``author=None`` means no user."""
+    return SimpleNamespace(
+        id=id_,
+        body=body,
+        user=SimpleNamespace(login=author) if author else None,
+        created_at=created_at,
+    )
+
+
+_DEFAULT_COMMENTS = (
+    _make_comment(),
+    _make_comment(2, "Second comment", "commenter2", _ISSUE_COMMENT2_AT),
+)
+
+
+def _mock_labels(names: list[str]) -> list[SimpleNamespace]:
+    """Label objects for the given names, reusing pooled ones where possible."""
+    return [_LABEL_POOL.get(name) or SimpleNamespace(name=name) for name in names]
 
 
 def create_mock_issue(
-    number: int = 42,
-    title: str = "Test Issue",
-    body: str = "Issue body",
-    state: str = "open",
+    *,
     labels: list[str] | None = None,
-    author: str = "testuser",
-    comments: int = 0,
-    url: str = "https://github.com/owner/repo/issues/42",
+    author: str | None = None,
+    **fields,
 ):
-    """Helper to create a mock GitHub Issue object."""
-    mock_issue = MagicMock()
-    mock_issue.number = number
-    mock_issue.title = title
-    mock_issue.body = body
-    mock_issue.state = state
-    mock_issue.comments = comments
-    mock_issue.html_url = url
-    mock_issue.created_at = datetime(2024, 1, 15, 10, 0, 0)
-    mock_issue.updated_at = datetime(2024, 1, 15, 12, 0, 0)
-
-    # Create mock labels
-    mock_labels = []
-    for label_name in labels or []:
-        mock_label = MagicMock()
-        mock_label.name = label_name
-        mock_labels.append(mock_label)
-    mock_issue.labels = mock_labels
-
-    # Create mock user
-    mock_user = MagicMock()
-    mock_user.login = author
-    mock_issue.user = mock_user
-
-    return mock_issue
+    """Helper to create a mock GitHub Issue object.
+
+    Copies the default issue and overrides the given attributes; ``labels``
+    and ``author`` take plain names.
+    """
+    issue = copy.copy(_DEFAULT_ISSUE)
+    issue.__dict__.update(fields)
+    if labels is not None:
+        issue.labels = _mock_labels(labels)
+    if author is not None:
+        issue.user = SimpleNamespace(login=author)
+    return issue
 
 
 def create_mock_pr(
-    number: int = 123,
-    title: str = "Test PR",
-    body: str = "PR body",
-    state: str = "open",
+    *,
     labels: list[str] | None = None,
-    author: str = "prauthor",
-    head_ref: str = "feature/test",
-    base_ref: str = "main",
-    additions: int = 50,
-    deletions: int = 10,
-    changed_files: int = 3,
-    comments: int = 0,
-    url: str = "https://github.com/owner/repo/pull/123",
+    author: str | None = None,
+    head_ref: str | None = None,
+    base_ref: str | None = None,
+    **fields,
 ):
-    """Helper to create a mock GitHub PullRequest object."""
-    mock_pr = MagicMock()
-    mock_pr.number = number
-    mock_pr.title = title
-    mock_pr.body = body
-    mock_pr.state = state
-    mock_pr.additions = additions
-    mock_pr.deletions = deletions
-    mock_pr.changed_files = changed_files
-    mock_pr.comments = comments
-    mock_pr.html_url = url
-    mock_pr.created_at = datetime(2024, 1, 10, 8, 0, 0)
-    mock_pr.updated_at = datetime(2024, 1, 15, 14, 0, 0)
-
-    # Create mock labels
-    mock_labels = []
-    for label_name in labels or []:
-        mock_label = MagicMock()
-        mock_label.name = label_name
-        mock_labels.append(mock_label)
-    mock_pr.labels = mock_labels
-
-    # Create mock user
-    mock_user = MagicMock()
-    mock_user.login = author
-    mock_pr.user = mock_user
-
-    # Create mock head/base refs
-    mock_head = MagicMock()
-    mock_head.ref = head_ref
-    mock_pr.head = mock_head
-
-    mock_base = MagicMock()
-    mock_base.ref = base_ref
-    mock_pr.base = mock_base
-
-    return mock_pr
+    """Helper to create a mock GitHub PullRequest object.
+
+    Copies the default PR and overrides the given attributes; ``labels``,
+    ``author``, ``head_ref`` and ``base_ref`` take plain names.
+    """
+    pr = copy.copy(_DEFAULT_PR)
+    pr.__dict__.update(fields)
+    if labels is not None:
+        pr.labels = _mock_labels(labels)
+    if author is not None:
+        pr.user = SimpleNamespace(login=author)
+    if head_ref is not None:
+        pr.head = SimpleNamespace(ref=head_ref)
+    if base_ref is not None:
+        pr.base = SimpleNamespace(ref=base_ref)
+    return pr
+
+
+# Read-only lists of numbered mocks (number == index) for paging tests
+_FIVE_ISSUES = tuple(create_mock_issue(number=i) for i in range(5))
+_TEN_PRS = tuple(create_mock_pr(number=i) for i in range(10))
+_ASSIGNEES_3 = tuple(SimpleNamespace(login=name) for name in ("user1", "user2", "user3"))
+_ASSIGNEES_10 = tuple(SimpleNamespace(login=f"user{i}") for i in range(10))
+_LABELS_3 = (
+    SimpleNamespace(name="bug", color="d73a4a", description="Something isn't working"),
+    SimpleNamespace(name="enhancement", color="a2eeef", description="New feature"),
+    SimpleNamespace(name="documentation", color="0075ca", description=None),
+)
 
 
 class TestGitHubClientInit:
     """Tests for GitHubClient initialization."""
 
-    def test_init_with_token_from_settings(self, mock_github, mock_auth, mock_settings):
+    def test_init_with_token_from_settings(self, mock_auth):
         """Test client initialization uses token from settings."""
         client = GitHubClient()
 
         mock_auth.Token.assert_called_once_with("test-token-123")
 
-    def test_init_with_explicit_token(self, mock_github, mock_auth):
+    def test_init_with_explicit_token(self, mock_auth, mock_settings):
         """Test client initialization with explicit token overrides settings."""
-        with patch("app.services.github_client.settings") as mock_settings:
-            mock_settings.github_token = "settings-token"
-            client = GitHubClient(token="explicit-token")
+        mock_settings.github_token = "settings-token"
 
-            mock_auth.Token.assert_called_once_with("explicit-token")
+        client = GitHubClient(token="explicit-token")
 
-    def test_init_without_token(self, mock_github, mock_auth):
-        """Test client initialization without token uses unauthenticated Github."""
-        with patch("app.services.github_client.settings") as mock_settings:
-            mock_settings.github_token = None
-            client = GitHubClient()
+        mock_auth.Token.assert_called_once_with("explicit-token")
 
-            # Auth.Token should not be called
-            mock_auth.Token.assert_not_called()
+    def test_init_without_token(self, mock_auth, client_no_token):
+        """Test client initialization without token uses unauthenticated Github."""
+        # Auth.Token should not be called
+        mock_auth.Token.assert_not_called()
 
 
 class TestGetRepo:
     """Tests for GitHubClient.get_repo()."""
 
-    def test_get_repo_fetches_from_api(self, client, mock_github):
+    def test_get_repo_fetches_from_api(self, client, mock_github, mock_repo):
         """Test get_repo calls Github API."""
-        mock_repo = MagicMock()
-        mock_github.get_repo.return_value = mock_repo
-
         result = client.get_repo("owner", "repo")
 
         mock_github.get_repo.assert_called_once_with("owner/repo")
         assert result == mock_repo
 
-    def test_get_repo_caches_result(self, client, mock_github):
+    def test_get_repo_caches_result(self, client, mock_github, mock_repo):
         """Test get_repo caches the result for subsequent calls."""
-        mock_repo = MagicMock()
-        mock_github.get_repo.return_value = mock_repo
-
         # Call twice
         result1 = client.get_repo("owner", "repo")
         result2 = client.get_repo("owner", "repo")
@@ -227,10 +338,7 @@ class TestListIssues:
     def test_list_issues_basic(self, client, mock_github):
         """Test basic issue listing."""
         mock_issue = create_mock_issue()
-        mock_results = MagicMock()
-        mock_results.totalCount = 1
-        mock_results.__iter__ = lambda self: iter([mock_issue])
-        mock_github.search_issues.return_value = mock_results
+        mock_github.search_issues.return_value = _Results([mock_issue])
 
         issues, total = client.list_issues("owner", "repo")
 
@@ -242,64 +350,37 @@ class TestListIssues:
 
     def test_list_issues_builds_correct_query(self, client, mock_github):
         """Test that list_issues builds the correct search query."""
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
+        searches = _capture_searches(mock_github)
 
         client.list_issues("owner", "repo", state="open")
 
-        call_args = mock_github.search_issues.call_args
-        query = call_args[0][0]
+        [(query, _)] = searches
         assert "repo:owner/repo" in query
         assert "is:issue" in query
         assert "state:open" in query
 
-    def test_list_issues_state_all_omits_state_filter(self, client, mock_github):
-        """Test that state='all' doesn't add state filter."""
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
-
-        client.list_issues("owner", "repo", state="all")
-
-        query = mock_github.search_issues.call_args[0][0]
-        assert "state:" not in query
-
     def test_list_issues_with_labels(self, client, mock_github):
         """Test issue listing with label filters."""
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
+        searches = _capture_searches(mock_github)
 
         client.list_issues("owner", "repo", labels=["bug", "help wanted"])
 
-        query = mock_github.search_issues.call_args[0][0]
+        [(query, _)] = searches
         assert "label:bug" in query
         assert 'label:"help wanted"' in query
 
     def test_list_issues_with_search_query(self, client, mock_github):
         """Test issue listing with text search."""
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
+        searches = _capture_searches(mock_github)
 
         client.list_issues("owner", "repo", search_query="authentication error")
 
-        query = mock_github.search_issues.call_args[0][0]
+        [(query, _)] = searches
         assert query.startswith("authentication error ")
 
     def test_list_issues_pagination(self, client, mock_github):
         """Test issue listing with pagination."""
-        # Create 5 mock issues
-        mock_issues = [create_mock_issue(number=i) for i in range(5)]
-        mock_results = MagicMock()
-        mock_results.totalCount = 5
-        mock_results.__iter__ = lambda self: iter(mock_issues)
-        mock_github.search_issues.return_value = mock_results
+        mock_github.search_issues.return_value = _Results(_FIVE_ISSUES)
 
         # Get page 2 with 2 items per page
         issues, total = client.list_issues("owner", "repo", page=2, per_page=2)
@@ -310,73 +391,36 @@ class TestListIssues:
         assert issues[0].number == 2
         assert issues[1].number == 3
 
-    def test_list_issues_sort_options(self, client, mock_github):
-        """Test issue listing with different sort options."""
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
+    @pytest.mark.parametrize("kwargs, expected_sort, expected_order, query_excludes", [
+        ({"sort": "updated", "order": "asc"}, "updated", "asc", ()),
+        ({"sort": "invalid_sort"}, "created", "desc", ()),
+        ({"order": "invalid_order"}, "created", "desc", ()),
+        ({"state": "all"}, "created", "desc", ("state:",)),
+    ], ids=["sort_options", "invalid_sort_defaults", "invalid_order_defaults", "state_all"])
+    def test_list_issues_sort_order_and_state(
+        self, client, mock_github, kwargs, expected_sort, expected_order, query_excludes
+    ):
+        """Sort/order fall back to created/desc when invalid; state='all' adds no filter."""
+        searches = _capture_searches(mock_github)
 
-        client.list_issues("owner", "repo", sort="updated", order="asc")
+        client.list_issues("owner", "repo", **kwargs)
 
-        call_kwargs = mock_github.search_issues.call_args[1]
-        assert call_kwargs["sort"] == "updated"
-        assert call_kwargs["order"] == "asc"
-
-    def test_list_issues_invalid_sort_defaults(self, client, mock_github):
-        """Test that invalid sort field defaults to 'created'."""
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
-
-        client.list_issues("owner", "repo", sort="invalid_sort")
-
-        call_kwargs = mock_github.search_issues.call_args[1]
-        assert call_kwargs["sort"] == "created"
-
-    def test_list_issues_invalid_order_defaults(self, client, mock_github):
-        """Test that invalid order defaults to 'desc'."""
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
-
-        client.list_issues("owner", "repo", order="invalid_order")
-
-        call_kwargs = mock_github.search_issues.call_args[1]
-        assert call_kwargs["order"] == "desc"
+        [(query, call_kwargs)] = searches
+        assert call_kwargs["sort"] == expected_sort
+        assert call_kwargs["order"] == expected_order
+        for fragment in query_excludes:
+            assert fragment not in query
 
 
 class TestGetIssue:
     """Tests for GitHubClient.get_issue()."""
 
-    def test_get_issue_returns_issue_data(self, client, mock_github):
+    def test_get_issue_returns_issue_data(self, client, mock_repo):
         """Test get_issue returns correct IssueData."""
-        mock_repo = MagicMock()
         mock_issue = create_mock_issue(number=42, title="Bug Report", comments=2)
 
-        # Create mock comments
-        mock_comment1 = MagicMock()
-        mock_comment1.id = 1
-        mock_comment1.body = "First comment"
-        mock_comment1.created_at = datetime(2024, 1, 15, 11, 0, 0)
-        mock_comment1_user = MagicMock()
-        mock_comment1_user.login = "commenter1"
-        mock_comment1.user = mock_comment1_user
-
-        mock_comment2 = MagicMock()
-        mock_comment2.id = 2
-        mock_comment2.body = "Second comment"
-        mock_comment2.created_at = datetime(2024, 1, 15, 12, 0, 0)
-        mock_comment2_user = MagicMock()
-        mock_comment2_user.login = "commenter2"
-        mock_comment2.user = mock_comment2_user
-
-        mock_issue.get_comments.return_value = [mock_comment1, mock_comment2]
-
+        mock_issue.get_comments = lambda: _DEFAULT_COMMENTS
         mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
 
         result = client.get_issue("owner", "repo", 42)
 
@@ -388,20 +432,13 @@ class TestGetIssue:
         assert result.comments[0].author == "commenter1"
         assert result.comments[1].body == "Second comment"
 
-    def test_get_issue_handles_null_user(self, client, mock_github):
+    def test_get_issue_handles_null_user(self, client, mock_repo):
         """Test get_issue handles comments with null user."""
-        mock_repo = MagicMock()
         mock_issue = create_mock_issue()
 
-        mock_comment = MagicMock()
-        mock_comment.id = 1
-        mock_comment.body = "Anonymous comment"
-        mock_comment.created_at = datetime(2024, 1, 15, 11, 0, 0)
-        mock_comment.user = None
-
-        mock_issue.get_comments.return_value = [mock_comment]
+        mock_comment = _make_comment(body="Anonymous comment", author=None)
+        mock_issue.get_comments = lambda: [mock_comment]
         mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
 
         result = client.get_issue("owner", "repo", 42)
 
@@ -411,68 +448,32 @@ class TestGetIssue:
 class TestListPRs:
     """Tests for GitHubClient.list_prs()."""
 
-    def test_list_prs_basic(self, client, mock_github):
-        """Test basic PR listing."""
-        mock_repo = MagicMock()
-        mock_pr = create_mock_pr()
-        # Search returns Issue objects, then we fetch full PR data
-        mock_issue = MagicMock()
-        mock_issue.number = mock_pr.number
-        mock_results = MagicMock()
-        mock_results.totalCount = 1
-        mock_results.__iter__ = lambda self: iter([mock_issue])
-        mock_github.search_issues.return_value = mock_results
-        mock_repo.get_pull.return_value = mock_pr
-        mock_github.get_repo.return_value = mock_repo
-
-        prs, total = client.list_prs("owner", "repo")
-
-        assert len(prs) == 1
-        assert total == 1
-        assert prs[0].number == 123
-        assert prs[0].title == "Test PR"
-
-    def test_list_prs_with_state(self, client, mock_github):
-        """Test PR listing with different states."""
-        mock_repo = MagicMock()
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
-        mock_github.get_repo.return_value = mock_repo
-
-        client.list_prs("owner", "repo", state="closed")
-
-        # Verify search query includes state:closed
-        query = mock_github.search_issues.call_args[0][0]
-        assert "state:closed" in query
-
-    def test_list_prs_respects_per_page(self, client, mock_github):
-        """Test PR listing respects the per_page parameter."""
-        mock_repo = MagicMock()
-        mock_prs = [create_mock_pr(number=i) for i in range(10)]
-        # Create mock issues to be returned by search
-        mock_issues = []
-        for pr in mock_prs:
-            mock_issue = MagicMock()
-            mock_issue.number = pr.number
-            mock_issues.append(mock_issue)
-        mock_results = MagicMock()
-        mock_results.totalCount = 10
-        mock_results.__iter__ = lambda self: iter(mock_issues)
-        mock_github.search_issues.return_value = mock_results
-        # Return corresponding PR for each issue number
-        mock_repo.get_pull.side_effect = mock_prs
-        mock_github.get_repo.return_value = mock_repo
-
-        prs, total = client.list_prs("owner", "repo", per_page=3)
-
-        assert len(prs) == 3
-        assert total == 10
-
-    def test_list_prs_converts_to_pr_data(self, client, mock_github):
+    @pytest.mark.parametrize("state, per_page, n_results, n_expected", [
+        ("open", None, 1, 1),
+        ("closed", None, 0, 0),
+        ("open", 3, 10, 3),
+    ], ids=["basic", "closed_state", "respects_per_page"])
+    def test_list_prs(
+        self, client, mock_github, mock_repo, state, per_page, n_results, n_expected
+    ):
+        """list_prs filters by state, pages results and fetches each PR by number."""
+        # Search returns Issue objects (only .number is read), then we fetch full PR data
+        searches = _capture_searches(mock_github, _TEN_PRS[:n_results])
+        mock_repo.get_pull.side_effect = _TEN_PRS.__getitem__
+        kwargs = {"state": state}
+        if per_page:
+            kwargs["per_page"] = per_page
+
+        prs, total = client.list_prs("owner", "repo", **kwargs)
+
+        [(query, _)] = searches
+        assert f"state:{state}" in query
+        assert total == n_results
+        assert [pr.number for pr in prs] == list(range(n_expected))
+        assert all(pr.title == "Test PR" for pr in prs)
+
+    def test_list_prs_converts_to_pr_data(self, client, mock_github, mock_repo):
         """Test that PR objects are converted to PRData."""
-        mock_repo = MagicMock()
         mock_pr = create_mock_pr(
             number=456,
             title="Feature PR",
@@ -486,12 +487,8 @@ class TestListPRs:
         # Mock search results
         mock_issue = MagicMock()
         mock_issue.number = 456
-        mock_results = MagicMock()
-        mock_results.totalCount = 1
-        mock_results.__iter__ = lambda self: iter([mock_issue])
-        mock_github.search_issues.return_value = mock_results
+        mock_github.search_issues.return_value = _Results([mock_issue])
         mock_repo.get_pull.return_value = mock_pr
-        mock_github.get_repo.return_value = mock_repo
 
         prs, total = client.list_prs("owner", "repo")
 
@@ -508,15 +505,11 @@ class TestListPRs:
 class TestGetPR:
     """Tests for GitHubClient.get_pr()."""
 
-    def test_get_pr_returns_pr_data(self, client, mock_github):
+    def test_get_pr_returns_pr_data(self, client, mock_repo, mock_issue):
         """Test get_pr returns correct PRData."""
-        mock_repo = MagicMock()
         mock_pr = create_mock_pr(number=789, title="Important PR")
-        mock_issue = MagicMock()
         mock_issue.get_comments.return_value = []
         mock_repo.get_pull.return_value = mock_pr
-        mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
 
         result = client.get_pr("owner", "repo", 789)
 
@@ -525,33 +518,15 @@ class TestGetPR:
         assert result.title == "Important PR"
         mock_repo.get_pull.assert_called_once_with(789)
 
-    def test_get_pr_includes_comments(self, client, mock_github):
+    def test_get_pr_includes_comments(self, client, mock_repo, mock_issue):
         """Test get_pr includes comments from issue endpoint."""
-        mock_repo = MagicMock()
         mock_pr = create_mock_pr(number=456)
-        mock_issue = MagicMock()
 
-        # Create mock comments
-        mock_comment1 = MagicMock()
-        mock_comment1.id = 101
-        mock_comment1.body = "LGTM!"
-        mock_comment1.created_at = datetime(2024, 1, 16, 10, 0, 0)
-        mock_user1 = MagicMock()
-        mock_user1.login = "reviewer1"
-        mock_comment1.user = mock_user1
-
-        mock_comment2 = MagicMock()
-        mock_comment2.id = 102
-        mock_comment2.body = "Please fix the typo"
-        mock_comment2.created_at = datetime(2024, 1, 16, 11, 0, 0)
-        mock_user2 = MagicMock()
-        mock_user2.login = "reviewer2"
-        mock_comment2.user = mock_user2
-
-        mock_issue.get_comments.return_value = [mock_comment1, mock_comment2]
+        mock_issue.get_comments.return_value = [
+            _make_comment(101, "LGTM!", "reviewer1", _PR_COMMENT1_AT),
+            _make_comment(102, "Please fix the typo", "reviewer2", _PR_COMMENT2_AT),
+        ]
         mock_repo.get_pull.return_value = mock_pr
-        mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
 
         result = client.get_pr("owner", "repo", 456)
 
@@ -564,45 +539,27 @@ class TestGetPR:
         # Verify we fetch comments from issue endpoint
         mock_repo.get_issue.assert_called_once_with(456)
 
-    def test_get_pr_handles_null_comment_user(self, client, mock_github):
+    def test_get_pr_handles_null_comment_user(self, client, mock_repo, mock_issue):
         """Test get_pr handles comments with null user."""
-        mock_repo = MagicMock()
         mock_pr = create_mock_pr()
-        mock_issue = MagicMock()
-
-        mock_comment = MagicMock()
-        mock_comment.id = 1
-        mock_comment.body = "Anonymous review"
-        mock_comment.created_at = datetime(2024, 1, 16, 12, 0, 0)
-        mock_comment.user = None
 
-        mock_issue.get_comments.return_value = [mock_comment]
+        mock_issue.get_comments.return_value = [
+            _make_comment(body="Anonymous review", author=None, created_at=_PR_COMMENT1_AT)
+        ]
         mock_repo.get_pull.return_value = mock_pr
-        mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
 
         result = client.get_pr("owner", "repo", 123)
 
         assert result.comments[0].author == "unknown"
 
-    def test_get_pr_handles_null_comment_body(self, client, mock_github):
+    def test_get_pr_handles_null_comment_body(self, client, mock_repo, mock_issue):
         """Test get_pr handles comments with null body."""
-        mock_repo = MagicMock()
         mock_pr = create_mock_pr()
-        mock_issue = MagicMock()
 
-        mock_comment = MagicMock()
-        mock_comment.id = 1
-        mock_comment.body = None
-        mock_comment.created_at = datetime(2024, 1, 16, 12, 0, 0)
-        mock_user = MagicMock()
-        mock_user.login = "commenter"
-        mock_comment.user = mock_user
-
-        mock_issue.get_comments.return_value = [mock_comment]
+        mock_issue.get_comments.return_value = [
+            _make_comment(body=None, author="commenter", created_at=_PR_COMMENT1_AT)
+        ]
         mock_repo.get_pull.return_value = mock_pr
-        mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
 
         result = client.get_pr("owner", "repo", 123)
 
@@ -612,65 +569,41 @@ class TestGetPR:
 class TestIssueMutations:
     """Tests for issue mutation methods."""
 
-    def test_add_comment(self, client, mock_github):
+    def test_add_comment(self, client, mock_issue):
         """Test adding a comment to an issue."""
-        mock_repo = MagicMock()
-        mock_issue = MagicMock()
         mock_comment = MagicMock()
         mock_comment.id = 12345
 
-        mock_repo.get_issue.return_value = mock_issue
         mock_issue.create_comment.return_value = mock_comment
-        mock_github.get_repo.return_value = mock_repo
 
         result = client.add_comment("owner", "repo", 42, "Great work!")
 
         assert result == 12345
         mock_issue.create_comment.assert_called_once_with("Great work!")
 
-    def test_add_labels(self, client, mock_github):
+    def test_add_labels(self, client, mock_issue):
         """Test adding labels to an issue."""
-        mock_repo = MagicMock()
-        mock_issue = MagicMock()
-
-        mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
-
         client.add_labels("owner", "repo", 42, ["bug", "priority"])
 
         mock_issue.add_to_labels.assert_called_once_with("bug", "priority")
 
-    def test_close_issue(self, client, mock_github):
+    def test_close_issue(self, client, mock_issue):
         """Test closing an issue."""
-        mock_repo = MagicMock()
-        mock_issue = MagicMock()
-
-        mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
-
         client.close_issue("owner", "repo", 42)
 
         mock_issue.edit.assert_called_once_with(state="closed")
 
-    def test_reopen_issue(self, client, mock_github):
+    def test_reopen_issue(self, client, mock_issue):
         """Test reopening an issue."""
-        mock_repo = MagicMock()
-        mock_issue = MagicMock()
-
-        mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
-
         client.reopen_issue("owner", "repo", 42)
 
         mock_issue.edit.assert_called_once_with(state="open")
 
-    def test_create_issue(self, client, mock_github):
+    def test_create_issue(self, client, mock_repo):
         """Test creating a new issue."""
-        mock_repo = MagicMock()
         mock_issue = create_mock_issue(number=999, title="New Issue")
 
         mock_repo.create_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
 
         result = client.create_issue(
             "owner",
@@ -690,13 +623,11 @@ class TestIssueMutations:
             assignees=["developer1"],
         )
 
-    def test_create_issue_default_labels_and_assignees(self, client, mock_github):
+    def test_create_issue_default_labels_and_assignees(self, client, mock_repo):
         """Test creating issue with default empty labels and assignees."""
-        mock_repo = MagicMock()
         mock_issue = create_mock_issue()
 
         mock_repo.create_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
 
         client.create_issue("owner", "repo", title="Basic Issue", body="Body")
 
@@ -711,56 +642,25 @@ class TestIssueMutations:
 class TestHelperMethods:
     """Tests for helper methods."""
 
-    def test_get_assignable_users(self, client, mock_github):
+    def test_get_assignable_users(self, client, mock_repo):
         """Test getting assignable users."""
-        mock_repo = MagicMock()
-        mock_users = []
-        for name in ["user1", "user2", "user3"]:
-            mock_user = MagicMock()
-            mock_user.login = name
-            mock_users.append(mock_user)
-
-        mock_repo.get_assignees.return_value = mock_users
-        mock_github.get_repo.return_value = mock_repo
+        mock_repo.get_assignees.return_value = _ASSIGNEES_3
 
         result = client.get_assignable_users("owner", "repo")
 
         assert result == ["user1", "user2", "user3"]
 
-    def test_get_assignable_users_respects_limit(self, client, mock_github):
+    def test_get_assignable_users_respects_limit(self, client, mock_repo):
         """Test that get_assignable_users respects the limit."""
-        mock_repo = MagicMock()
-        mock_users = []
-        for i in range(10):
-            mock_user = MagicMock()
-            mock_user.login = f"user{i}"
-            mock_users.append(mock_user)
-
-        mock_repo.get_assignees.return_value = mock_users
-        mock_github.get_repo.return_value = mock_repo
+        mock_repo.get_assignees.return_value = _ASSIGNEES_10
 
         result = client.get_assignable_users("owner", "repo", limit=3)
 
         assert len(result) == 3
 
-    def test_get_available_labels(self, client, mock_github):
+    def test_get_available_labels(self, client, mock_repo):
         """Test getting available labels."""
-        mock_repo = MagicMock()
-        mock_labels = []
-
-        for name, color, desc in [
-            ("bug", "d73a4a", "Something isn't working"),
-            ("enhancement", "a2eeef", "New feature"),
-            ("documentation", "0075ca", None),
-        ]:
-            mock_label = MagicMock()
-            mock_label.name = name
-            mock_label.color = color
-            mock_label.description = desc
-            mock_labels.append(mock_label)
-
-        mock_repo.get_labels.return_value = mock_labels
-        mock_github.get_repo.return_value = mock_repo
+        mock_repo.get_labels.return_value = _LABELS_3
 
         result = client.get_available_labels("owner", "repo")
 
@@ -776,127 +676,61 @@ class TestHelperMethods:
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
 
-    def test_issue_with_null_body(self, client, mock_github):
-        """Test handling issue with null body."""
-        mock_issue = create_mock_issue(body=None)
-        mock_issue.body = None  # Explicitly set to None
-
-        mock_results = MagicMock()
-        mock_results.totalCount = 1
-        mock_results.__iter__ = lambda self: iter([mock_issue])
-        mock_github.search_issues.return_value = mock_results
-
-        issues, _ = client.list_issues("owner", "repo")
-
-        assert issues[0].body == ""
-
-    def test_pr_with_null_body(self, client, mock_github):
-        """Test handling PR with null body."""
-        mock_repo = MagicMock()
-        mock_pr = create_mock_pr()
-        mock_pr.body = None
-
-        mock_issue = MagicMock()
-        mock_issue.number = mock_pr.number
-        mock_results = MagicMock()
-        mock_results.totalCount = 1
-        mock_results.__iter__ = lambda self: iter([mock_issue])
-        mock_github.search_issues.return_value = mock_results
-        mock_repo.get_pull.return_value = mock_pr
-        mock_github.get_repo.return_value = mock_repo
-
-        prs, _ = client.list_prs("owner", "repo")
-
-        assert prs[0].body == ""
-
-    def test_issue_with_null_user(self, client, mock_github):
-        """Test handling issue with null user (deleted account)."""
-        mock_issue = create_mock_issue()
-        mock_issue.user = None
-
-        mock_results = MagicMock()
-        mock_results.totalCount = 1
-        mock_results.__iter__ = lambda self: iter([mock_issue])
-        mock_github.search_issues.return_value = mock_results
+    @pytest.mark.parametrize("attribute, value, field, expected", [
+        ("body", None, "body", ""),
+        ("user", None, "author", "unknown"),  # deleted account
+        ("labels", [], "labels", []),
+    ], ids=["null_body", "null_user", "empty_labels"])
+    def test_issue_edge_cases(self, client, mock_github, attribute, value, field, expected):
+        """Missing issue fields fall back to safe defaults."""
+        mock_issue = create_mock_issue(**{attribute: value})
+        mock_github.search_issues.return_value = _Results([mock_issue])
 
         issues, _ = client.list_issues("owner", "repo")
 
-        assert issues[0].author == "unknown"
-
-    def test_pr_with_null_user(self, client, mock_github):
-        """Test handling PR with null user."""
-        mock_repo = MagicMock()
-        mock_pr = create_mock_pr()
-        mock_pr.user = None
-
-        mock_issue = MagicMock()
-        mock_issue.number = mock_pr.number
-        mock_results = MagicMock()
-        mock_results.totalCount = 1
-        mock_results.__iter__ = lambda self: iter([mock_issue])
-        mock_github.search_issues.return_value = mock_results
+        assert getattr(issues[0], field) == expected
+
+    @pytest.mark.parametrize("attribute, value, field, expected", [
+        ("body", None, "body", ""),
+        ("user", None, "author", "unknown"),
+    ], ids=["null_body", "null_user"])
+    def test_pr_edge_cases(
+        self, client, mock_github, mock_repo, attribute, value, field, expected
+    ):
+        """Missing PR fields fall back to safe defaults."""
+        mock_pr = create_mock_pr(**{attribute: value})
+        mock_github.search_issues.return_value = _Results([SimpleNamespace(number=mock_pr.number)])
         mock_repo.get_pull.return_value = mock_pr
-        mock_github.get_repo.return_value = mock_repo
 
         prs, _ = client.list_prs("owner", "repo")
 
-        assert prs[0].author == "unknown"
+        assert getattr(prs[0], field) == expected
 
     def test_empty_issue_list(self, client, mock_github):
         """Test handling empty issue search results."""
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
+        mock_github.search_issues.return_value = _Results([])
 
         issues, total = client.list_issues("owner", "repo")
 
         assert issues == []
         assert total == 0
 
-    def test_empty_pr_list(self, client, mock_github):
+    def test_empty_pr_list(self, client, mock_github, mock_repo):
         """Test handling empty PR list."""
-        mock_repo = MagicMock()
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
-        mock_github.get_repo.return_value = mock_repo
+        mock_github.search_issues.return_value = _Results([])
 
         prs, total = client.list_prs("owner", "repo")
 
         assert prs == []
         assert total == 0
 
-    def test_issue_with_empty_labels(self, client, mock_github):
-        """Test handling issue with no labels."""
-        mock_issue = create_mock_issue(labels=[])
-
-        mock_results = MagicMock()
-        mock_results.totalCount = 1
-        mock_results.__iter__ = lambda self: iter([mock_issue])
-        mock_github.search_issues.return_value = mock_results
-
-        issues, _ = client.list_issues("owner", "repo")
-
-        assert issues[0].labels == []
-
-    def test_comment_with_empty_body(self, client, mock_github):
+    def test_comment_with_empty_body(self, client, mock_repo):
         """Test handling comment with empty body."""
-        mock_repo = MagicMock()
         mock_issue = create_mock_issue()
 
-        mock_comment = MagicMock()
-        mock_comment.id = 1
-        mock_comment.body = None
-        mock_comment.created_at = datetime(2024, 1, 15, 11, 0, 0)
-        mock_user = MagicMock()
-        mock_user.login = "commenter"
-        mock_comment.user = mock_user
-
-        mock_issue.get_comments.return_value = [mock_comment]
+        mock_comment = _make_comment(body=None, author="commenter")
+        mock_issue.get_comments = lambda: [mock_comment]
         mock_repo.get_issue.return_value = mock_issue
-        mock_github.get_repo.return_value = mock_repo
 
         result = client.get_issue("owner", "repo", 42)
 
@@ -906,61 +740,41 @@ class TestEdgeCases:
 class TestListPRsSearchQuery:
     """Tests for PR listing search query functionality."""
 
-    def test_list_prs_with_search_query(self, client, mock_github):
+    def test_list_prs_with_search_query(self, client, mock_github, mock_repo):
         """Test PR listing with text search."""
-        mock_repo = MagicMock()
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
-        mock_github.get_repo.return_value = mock_repo
+        searches = _capture_searches(mock_github)
 
         client.list_prs("owner", "repo", search_query="fix bug")
 
-        query = mock_github.search_issues.call_args[0][0]
+        [(query, _)] = searches
         assert query.startswith("fix bug ")
         assert "is:pr" in query
 
-    def test_list_prs_invalid_sort_defaults_to_created(self, client, mock_github):
+    def test_list_prs_invalid_sort_defaults_to_created(self, client, mock_github, mock_repo):
         """Test that invalid sort field defaults to 'created'."""
-        mock_repo = MagicMock()
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
-        mock_github.get_repo.return_value = mock_repo
+        searches = _capture_searches(mock_github)
 
         client.list_prs("owner", "repo", sort="comments")  # 'comments' not valid for PRs
 
-        call_kwargs = mock_github.search_issues.call_args[1]
+        [(_, call_kwargs)] = searches
         assert call_kwargs["sort"] == "created"
 
-    def test_list_prs_invalid_order_defaults_to_desc(self, client, mock_github):
+    def test_list_prs_invalid_order_defaults_to_desc(self, client, mock_github, mock_repo):
         """Test that invalid order defaults to 'desc'."""
-        mock_repo = MagicMock()
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
-        mock_github.get_repo.return_value = mock_repo
+        searches = _capture_searches(mock_github)
 
         client.list_prs("owner", "repo", order="random")
 
-        call_kwargs = mock_github.search_issues.call_args[1]
+        [(_, call_kwargs)] = searches
         assert call_kwargs["order"] == "desc"
 
-    def test_list_prs_state_all_omits_state_filter(self, client, mock_github):
+    def test_list_prs_state_all_omits_state_filter(self, client, mock_github, mock_repo):
         """Test that state='all' doesn't add state filter for PRs."""
-        mock_repo = MagicMock()
-        mock_results = MagicMock()
-        mock_results.totalCount = 0
-        mock_results.__iter__ = lambda self: iter([])
-        mock_github.search_issues.return_value = mock_results
-        mock_github.get_repo.return_value = mock_repo
+        searches = _capture_searches(mock_github)
 
         client.list_prs("owner", "repo", state="all")
 
-        query = mock_github.search_issues.call_args[0][0]
+        [(query, _)] = searches
         assert "state:" not in query
 
 
@@ -1012,13 +826,13 @@ class TestDataclasses:
             id=123,
             author="testuser",
             body="Test comment",
-            created_at=datetime(2024, 1, 15, 10, 0, 0),
+            created_at=_ISSUE_CREATED_AT,
         )
 
         assert comment.id == 123
         assert comment.author == "testuser"
         assert comment.body == "Test comment"
-        assert comment.created_at == datetime(2024, 1, 15, 10, 0, 0)
+        assert comment.created_at == _ISSUE_CREATED_AT
 
     def test_pr_comment_structure(self):
         """Test PRComment has all required fields."""
@@ -1026,10 +840,10 @@ class TestDataclasses:
             id=456,
             author="reviewer",
             body="LGTM",
-            created_at=datetime(2024, 1, 16, 14, 30, 0),
+            created_at=_REVIEW_AT,
         )
 
         assert comment.id == 456
         assert comment.author == "reviewer"
         assert comment.body == "LGTM"
-        assert comment.created_at == datetime(2024, 1, 16, 14, 30, 0)
+        assert comment.created_at == _REVIEW_AT
@@ -16,23 +16,29 @@ Tests cover:
 - GET /repos/{repo_id}/assignees (get assignees)
 """
 
+import dataclasses
 import pytest
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
 
+import app.routers.github as _github
 from app.routers.github import (
     router,
     parse_github_remote,
+    create_issue,
+    delete_repo,
+    IssueCreate,
     RepoResponse,
     IssueResponse,
     PRResponse,
 )
-from app.services.github_client import IssueData, PRData, IssueComment
+from app.services.github_client import GitHubClient, IssueData, PRData, IssueComment
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app():
     """Create a test FastAPI app with the github router."""
     app = FastAPI()
@@ -40,171 +46,185 @@ def app():
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
-    """Create a test client."""
+    """Create a test client (stateless, so shared across the module)."""
     return TestClient(app)
 
 
+# Shared by every test that needs them; none mutate them (the repo row is
+# read-only, and the dataclasses are copied with dataclasses.replace)
+_MOCK_REPO_INFO = MappingProxyType({
+    "id": 1,
+    "owner": "test-owner",
+    "name": "test-repo",
+    "local_path": "/home/user/projects/test-repo",
+})
+
+_MOCK_ISSUE = IssueData(
+    number=42,
+    title="Test Issue",
+    body="This is a test issue body",
+    state="open",
+    labels=["bug", "help wanted"],
+    author="testuser",
+    created_at=datetime(2024, 1, 15, 10, 30, 0),
+    updated_at=datetime(2024, 1, 15, 12, 0, 0),
+    comments_count=3,
+    url="https://github.com/test-owner/test-repo/issues/42",
+    comments=None,
+)
+
+_MOCK_PR = PRData(
+    number=123,
+    title="Test PR",
+    body="This is a test PR body",
+    state="open",
+    labels=["enhancement"],
+    author="prauthor",
+    created_at=datetime(2024, 1, 10, 8, 0, 0),
+    updated_at=datetime(2024, 1, 15, 14, 0, 0),
+    head_ref="feature/test",
+    base_ref="main",
+    additions=50,
+    deletions=10,
+    changed_files=3,
+    url="https://github.com/test-owner/test-repo/pull/123",
+)
+
+
 @pytest.fixture
 def mock_repo_info():
-    """Create a mock repo info dict."""
-    return {
-        "id": 1,
-        "owner": "test-owner",
-        "name": "test-repo",
-        "local_path": "/home/user/projects/test-repo",
-    }
+    """Read-only repo info dict."""
+    return _MOCK_REPO_INFO
 
 
 @pytest.fixture
 def mock_issue_data():
-    """Create a mock IssueData."""
-    return IssueData(
-        number=42,
-        title="Test Issue",
-        body="This is a test issue body",
-        state="open",
-        labels=["bug", "help wanted"],
-        author="testuser",
-        created_at=datetime(2024, 1, 15, 10, 30, 0),
-        updated_at=datetime(2024, 1, 15, 12, 0, 0),
-        comments_count=3,
-        url="https://github.com/test-owner/test-repo/issues/42",
-        comments=None,
-    )
+    """Shared IssueData; copy it before changing fields."""
+    return _MOCK_ISSUE
 
 
 @pytest.fixture
 def mock_pr_data():
-    """Create a mock PRData."""
-    return PRData(
-        number=123,
-        title="Test PR",
-        body="This is a test PR body",
-        state="open",
-        labels=["enhancement"],
-        author="prauthor",
-        created_at=datetime(2024, 1, 10, 8, 0, 0),
-        updated_at=datetime(2024, 1, 15, 14, 0, 0),
-        head_ref="feature/test",
-        base_ref="main",
-        additions=50,
-        deletions=10,
-        changed_files=3,
-        url="https://github.com/test-owner/test-repo/pull/123",
-    )
+    """Shared PRData; copy it before changing fields."""
+    return _MOCK_PR
+
+
+# Attribute names of GitHubClient, computed once so each spec'd mock skips
+# introspecting the class
+_GITHUB_CLIENT_SPEC = tuple(dir(GitHubClient))
+
+# Other collaborators of the router replaced by mocks for every test
+_PATCHED_NAMES = (
+    "get_repo_or_404",
+    "load_repos",
+    "storage_add_repo",
+    "storage_delete_repo",
+    "delete_repo_data",
+    "clear_engine_cache",
+)
 
 
-class TestParseGitHubRemote:
-    """Tests for the parse_github_remote helper function."""
+@pytest.fixture(autouse=True)
+def mocks(monkeypatch):
+    """Mocks installed over app.routers.github's collaborators, keyed by name."""
+    mocks = {name: MagicMock() for name in _PATCHED_NAMES}
+    mocks["github_client"] = MagicMock(spec=_GITHUB_CLIENT_SPEC)
+    mocks["parse_github_remote"] = AsyncMock()
+    for name, mock in mocks.items():
+        monkeypatch.setattr(_github, name, mock)
+    return mocks
 
-    def test_parse_ssh_url(self, tmp_path):
-        """Test parsing SSH remote URL."""
-        # Create a mock git repo
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-        config_file = git_dir / "config"
-        config_file.write_text(
-            "[remote \"origin\"]\n"
-            "    url = git@github.com:owner/repo.git\n"
-        )
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="git@github.com:owner/repo.git\n",
-            )
-            owner, name = parse_github_remote(str(tmp_path))
+def _fake_git_process(stdout: str, returncode: int = 0) -> SimpleNamespace:
+    """Stand-in for the asyncio subprocess running ``git remote get-url``."""
+    async def communicate():
+        return stdout.encode(), b""
 
-        assert owner == "owner"
-        assert name == "repo"
+    return SimpleNamespace(returncode=returncode, communicate=communicate)
 
-    def test_parse_https_url(self, tmp_path):
-        """Test parsing HTTPS remote URL."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="https://github.com/owner/repo.git\n",
-            )
-            owner, name = parse_github_remote(str(tmp_path))
+@pytest.fixture
+def git_remote(monkeypatch):
+    """Mock for the subprocess that parse_github_remote spawns to read the origin URL.
 
-        assert owner == "owner"
-        assert name == "repo"
+    Tests set ``return_value`` to a ``_fake_git_process``.
+    """
+    mock = AsyncMock()
+    monkeypatch.setattr(_github.asyncio, "create_subprocess_exec", mock)
+    return mock
 
-    def test_parse_https_url_without_git_extension(self, tmp_path):
-        """Test parsing HTTPS URL without .git extension."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="https://github.com/owner/repo\n",
-            )
-            owner, name = parse_github_remote(str(tmp_path))
+@pytest.fixture(scope="module")
+def git_repo(tmp_path_factory):
+    """A directory that looks like a git repository to parse_github_remote.
+
+    Only read by the tests (git itself is mocked), so one is shared per module.
+    """
+    path = tmp_path_factory.mktemp("repo")
+    (path / ".git").mkdir()
+    return path
+
+
+class TestParseGitHubRemote:
+    """Tests for the parse_github_remote helper function."""
+
+    @pytest.mark.parametrize("stdout", [
+        "git@github.com:owner/repo.git\n",
+        "https://github.com/owner/repo.git\n",
+        "https://github.com/owner/repo\n",
+    ], ids=["ssh", "https", "https_without_git_extension"])
+    async def test_parse_remote_url(self, git_repo, git_remote, stdout):
+        """Test parsing SSH and HTTPS remote URLs."""
+        git_remote.return_value = _fake_git_process(stdout)
+
+        owner, name = await parse_github_remote(str(git_repo))
 
         assert owner == "owner"
         assert name == "repo"
 
-    def test_path_not_exists(self, tmp_path):
+    async def test_path_not_exists(self, tmp_path):
         """Test error when path doesn't exist."""
         nonexistent = tmp_path / "nonexistent"
         with pytest.raises(ValueError, match="Path does not exist"):
-            parse_github_remote(str(nonexistent))
+            await parse_github_remote(str(nonexistent))
 
-    def test_not_git_repo(self, tmp_path):
+    async def test_not_git_repo(self, tmp_path):
         """Test error when path is not a git repository."""
         with pytest.raises(ValueError, match="Not a git repository"):
-            parse_github_remote(str(tmp_path))
+            await parse_github_remote(str(tmp_path))
 
-    def test_no_origin_remote(self, tmp_path):
+    async def test_no_origin_remote(self, git_repo, git_remote):
         """Test error when no origin remote exists."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
+        git_remote.return_value = _fake_git_process("", returncode=1)
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=1,
-                stdout="",
-            )
-            with pytest.raises(ValueError, match="No 'origin' remote found"):
-                parse_github_remote(str(tmp_path))
+        with pytest.raises(ValueError, match="No 'origin' remote found"):
+            await parse_github_remote(str(git_repo))
 
-    def test_unparseable_remote(self, tmp_path):
+    async def test_unparseable_remote(self, git_repo, git_remote):
         """Test error when remote URL can't be parsed."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
+        git_remote.return_value = _fake_git_process("git@gitlab.com:owner/repo.git\n")
 
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="git@gitlab.com:owner/repo.git\n",
-            )
-            with pytest.raises(ValueError, match="Could not parse GitHub remote URL"):
-                parse_github_remote(str(tmp_path))
+        with pytest.raises(ValueError, match="Could not parse GitHub remote URL"):
+            await parse_github_remote(str(git_repo))
 
 
 class TestListRepos:
     """Tests for GET /repos endpoint."""
 
-    def test_list_repos_empty(self, client):
+    def test_list_repos_empty(self, client, mocks):
         """Test listing repos when none exist."""
-        with patch("app.routers.github.load_repos") as mock_load:
-            mock_load.return_value = []
-            response = client.get("/repos")
+        mocks["load_repos"].return_value = []
+        response = client.get("/repos")
 
         assert response.status_code == 200
         assert response.json() == []
 
-    def test_list_repos_with_data(self, client, mock_repo_info):
+    def test_list_repos_with_data(self, client, mocks, mock_repo_info):
         """Test listing repos with data."""
-        with patch("app.routers.github.load_repos") as mock_load:
-            mock_load.return_value = [mock_repo_info]
-            response = client.get("/repos")
+        mocks["load_repos"].return_value = [mock_repo_info]
+        response = client.get("/repos")
 
         assert response.status_code == 200
         data = response.json()
@@ -217,80 +237,70 @@ class TestListRepos:
 class TestCreateRepo:
     """Tests for POST /repos endpoint."""
 
-    def test_create_repo_with_owner_name(self, client, mock_repo_info):
+    def test_create_repo_with_owner_name(self, client, mocks, mock_repo_info):
         """Test creating a repo with explicit owner and name."""
-        with patch("app.routers.github.github_client") as mock_client, \
-             patch("app.routers.github.storage_add_repo") as mock_add:
-            mock_client.get_repo.return_value = MagicMock()
-            mock_add.return_value = mock_repo_info
-
-            response = client.post(
-                "/repos",
-                json={
-                    "local_path": "/home/user/projects/test-repo",
-                    "owner": "test-owner",
-                    "name": "test-repo",
-                },
-            )
+        mocks["github_client"].get_repo.return_value = object()
+        mocks["storage_add_repo"].return_value = mock_repo_info
+
+        response = client.post(
+            "/repos",
+            json={
+                "local_path": "/home/user/projects/test-repo",
+                "owner": "test-owner",
+                "name": "test-repo",
+            },
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["owner"] == "test-owner"
         assert data["name"] == "test-repo"
 
-    def test_create_repo_infer_from_git(self, client, mock_repo_info, tmp_path):
+    def test_create_repo_infer_from_git(self, client, mocks, mock_repo_info, git_repo):
         """Test creating a repo by inferring from git remote."""
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-
-        with patch("app.routers.github.parse_github_remote") as mock_parse, \
-             patch("app.routers.github.github_client") as mock_client, \
-             patch("app.routers.github.storage_add_repo") as mock_add:
-            mock_parse.return_value = ("inferred-owner", "inferred-repo")
-            mock_client.get_repo.return_value = MagicMock()
-            mock_add.return_value = {
-                **mock_repo_info,
-                "owner": "inferred-owner",
-                "name": "inferred-repo",
-            }
-
-            response = client.post(
-                "/repos",
-                json={"local_path": str(tmp_path)},
-            )
+        mocks["parse_github_remote"].return_value = ("inferred-owner", "inferred-repo")
+        mocks["github_client"].get_repo.return_value = object()
+        mocks["storage_add_repo"].return_value = {
+            **mock_repo_info,
+            "owner": "inferred-owner",
+            "name": "inferred-repo",
+        }
+
+        response = client.post(
+            "/repos",
+            json={"local_path": str(git_repo)},
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["owner"] == "inferred-owner"
         assert data["name"] == "inferred-repo"
 
-    def test_create_repo_github_not_found(self, client):
+    def test_create_repo_github_not_found(self, client, mocks):
         """Test error when repo doesn't exist on GitHub."""
-        with patch("app.routers.github.github_client") as mock_client:
-            mock_client.get_repo.side_effect = Exception("Not found")
-
-            response = client.post(
-                "/repos",
-                json={
-                    "local_path": "/path/to/repo",
-                    "owner": "owner",
-                    "name": "nonexistent",
-                },
-            )
+        mocks["github_client"].get_repo.side_effect = Exception("Not found")
+
+        response = client.post(
+            "/repos",
+            json={
+                "local_path": "/path/to/repo",
+                "owner": "owner",
+                "name": "nonexistent",
+            },
+        )
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
-    def test_create_repo_infer_fails(self, client, tmp_path):
+    def test_create_repo_infer_fails(self, client, mocks, tmp_path):
         """Test error when git remote inference fails."""
         # Path exists but is not a git repo
-        with patch("app.routers.github.parse_github_remote") as mock_parse:
-            mock_parse.side_effect = ValueError("Not a git repository")
+        mocks["parse_github_remote"].side_effect = ValueError("Not a git repository")
 
-            response = client.post(
-                "/repos",
-                json={"local_path": str(tmp_path)},
-            )
+        response = client.post(
+            "/repos",
+            json={"local_path": str(tmp_path)},
+        )
 
         assert response.status_code == 400
         assert "Could not infer" in response.json()["detail"]
@@ -299,46 +309,51 @@ class TestCreateRepo:
 class TestDeleteRepo:
     """Tests for DELETE /repos/{repo_id} endpoint."""
 
-    def test_delete_repo(self, client, mock_repo_info):
+    async def test_delete_repo(self, mocks, mock_repo_info):
         """Test deleting a repo."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.storage_delete_repo") as mock_delete, \
-             patch("app.routers.github.delete_repo_data") as mock_delete_data, \
-             patch("app.routers.github.clear_engine_cache") as mock_clear:
-            mock_get.return_value = mock_repo_info
+        mocks["get_repo_or_404"].return_value = mock_repo_info
 
-            response = client.delete("/repos/1")
+        result = await delete_repo(1)
 
-        assert response.status_code == 200
-        assert response.json()["status"] == "deleted"
-        mock_delete.assert_called_once_with(1)
-        mock_delete_data.assert_called_once()
-        mock_clear.assert_called_once()
+        assert result == {"status": "deleted"}
+        mocks["storage_delete_repo"].assert_called_once_with(1)
+        mocks["delete_repo_data"].assert_called_once()
+        mocks["clear_engine_cache"].assert_called_once()
 
-    def test_delete_repo_without_data(self, client, mock_repo_info):
+    async def test_delete_repo_without_data(self, mocks, mock_repo_info):
         """Test deleting a repo without deleting data."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.storage_delete_repo") as mock_delete, \
-             patch("app.routers.github.delete_repo_data") as mock_delete_data:
-            mock_get.return_value = mock_repo_info
+        mocks["get_repo_or_404"].return_value = mock_repo_info
 
-            response = client.delete("/repos/1?delete_data=false")
+        result = await delete_repo(1, delete_data=False)
 
-        assert response.status_code == 200
-        mock_delete_data.assert_not_called()
+        assert result == {"status": "deleted"}
+        mocks["delete_repo_data"].assert_not_called()
 
 
 class TestListIssues:
     """Tests for GET /repos/{repo_id}/issues endpoint."""
 
-    def test_list_issues(self, client, mock_repo_info, mock_issue_data):
-        """Test listing issues for a repo."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-            mock_client.list_issues.return_value = ([mock_issue_data], 1)
-
-            response = client.get("/repos/1/issues")
+    @pytest.mark.parametrize("params, expected_call", [
+        (
+            {},
+            dict(state="open", labels=None, search_query=None, sort="created",
+                 order="desc", page=1, per_page=30),
+        ),
+        (
+            {"state": "closed", "search": "bug", "labels": ["bug", "urgent"],
+             "sort": "updated", "order": "asc", "page": 2, "per_page": 10},
+            dict(state="closed", labels=["bug", "urgent"], search_query="bug",
+                 sort="updated", order="asc", page=2, per_page=10),
+        ),
+    ], ids=["defaults", "with_filters"])
+    def test_list_issues(
+        self, client, mocks, mock_repo_info, mock_issue_data, params, expected_call
+    ):
+        """Test listing issues, with and without filters."""
+        mocks["get_repo_or_404"].return_value = mock_repo_info
+        mocks["github_client"].list_issues.return_value = ([mock_issue_data], 1)
+
+        response = client.get("/repos/1/issues", params=params)
 
         assert response.status_code == 200
         data = response.json()
@@ -346,61 +361,29 @@ class TestListIssues:
         assert len(data["issues"]) == 1
         assert data["issues"][0]["number"] == 42
         assert data["issues"][0]["title"] == "Test Issue"
-
-    def test_list_issues_with_filters(self, client, mock_repo_info, mock_issue_data):
-        """Test listing issues with filters."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-            mock_client.list_issues.return_value = ([mock_issue_data], 1)
-
-            response = client.get(
-                "/repos/1/issues",
-                params={
-                    "state": "closed",
-                    "search": "bug",
-                    "labels": ["bug", "urgent"],
-                    "sort": "updated",
-                    "order": "asc",
-                    "page": 2,
-                    "per_page": 10,
-                },
-            )
-
-        assert response.status_code == 200
-        mock_client.list_issues.assert_called_once_with(
-            "test-owner",
-            "test-repo",
-            state="closed",
-            labels=["bug", "urgent"],
-            search_query="bug",
-            sort="updated",
-            order="asc",
-            page=2,
-            per_page=10,
+        mocks["github_client"].list_issues.assert_called_once_with(
+            "test-owner", "test-repo", **expected_call
         )
 
 
 class TestGetIssue:
     """Tests for GET /repos/{repo_id}/issues/{issue_number} endpoint."""
 
-    def test_get_issue(self, client, mock_repo_info, mock_issue_data):
+    def test_get_issue(self, client, mocks, mock_repo_info, mock_issue_data):
         """Test getting a single issue with comments."""
-        mock_issue_data.comments = [
+        issue = dataclasses.replace(mock_issue_data, comments=[
             IssueComment(
                 id=1,
                 author="commenter",
                 body="This is a comment",
                 created_at=datetime(2024, 1, 15, 11, 0, 0),
             )
-        ]
+        ])
 
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-            mock_client.get_issue.return_value = mock_issue_data
+        mocks["get_repo_or_404"].return_value = mock_repo_info
+        mocks["github_client"].get_issue.return_value = issue
 
-            response = client.get("/repos/1/issues/42")
+        response = client.get("/repos/1/issues/42")
 
         assert response.status_code == 200
         data = response.json()
@@ -412,25 +395,23 @@ class TestGetIssue:
 class TestCreateIssue:
     """Tests for POST /repos/{repo_id}/issues endpoint."""
 
-    def test_create_issue(self, client, mock_repo_info, mock_issue_data):
+    async def test_create_issue(self, mocks, mock_repo_info, mock_issue_data):
         """Test creating a new issue."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-            mock_client.create_issue.return_value = mock_issue_data
-
-            response = client.post(
-                "/repos/1/issues",
-                json={
-                    "title": "New Issue",
-                    "body": "Issue description",
-                    "labels": ["bug"],
-                    "assignees": ["user1"],
-                },
-            )
+        mocks["get_repo_or_404"].return_value = mock_repo_info
+        mocks["github_client"].create_issue.return_value = mock_issue_data
+
+        result = await create_issue(
+            1,
+            IssueCreate(
+                title="New Issue",
+                body="Issue description",
+                labels=["bug"],
+                assignees=["user1"],
+            ),
+        )
 
-        assert response.status_code == 200
-        mock_client.create_issue.assert_called_once_with(
+        assert result.number == 42
+        mocks["github_client"].create_issue.assert_called_once_with(
             "test-owner",
             "test-repo",
             "New Issue",
@@ -443,114 +424,99 @@ class TestCreateIssue:
 class TestIssueActions:
     """Tests for issue action endpoints."""
 
-    def test_create_comment(self, client, mock_repo_info):
+    def test_create_comment(self, client, mocks, mock_repo_info):
         """Test creating a comment on an issue."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-            mock_client.add_comment.return_value = 123
-
-            response = client.post(
-                "/repos/1/issues/42/comments",
-                json={"body": "A comment"},
-            )
+        mocks["get_repo_or_404"].return_value = mock_repo_info
+        mocks["github_client"].add_comment.return_value = 123
+
+        response = client.post(
+            "/repos/1/issues/42/comments",
+            json={"body": "A comment"},
+        )
 
         assert response.status_code == 200
         assert response.json()["id"] == 123
         assert response.json()["status"] == "created"
 
-    def test_close_issue(self, client, mock_repo_info):
-        """Test closing an issue."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-
-            response = client.post("/repos/1/issues/42/close")
-
-        assert response.status_code == 200
-        assert response.json()["status"] == "closed"
-        mock_client.close_issue.assert_called_once()
-
-    def test_reopen_issue(self, client, mock_repo_info):
-        """Test reopening an issue."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
+    @pytest.mark.parametrize("action, expected_status, client_method", [
+        ("close", "closed", "close_issue"),
+        ("reopen", "opened", "reopen_issue"),
+    ])
+    def test_close_or_reopen_issue(
+        self, client, mocks, mock_repo_info, action, expected_status, client_method
+    ):
+        """Test closing and reopening an issue."""
+        mocks["get_repo_or_404"].return_value = mock_repo_info
 
-            response = client.post("/repos/1/issues/42/reopen")
+        response = client.post(f"/repos/1/issues/42/{action}")
 
         assert response.status_code == 200
-        assert response.json()["status"] == "opened"
-        mock_client.reopen_issue.assert_called_once()
+        assert response.json()["status"] == expected_status
+        getattr(mocks["github_client"], client_method).assert_called_once_with(
+            "test-owner", "test-repo", 42
+        )
 
 
 class TestListPRs:
     """Tests for GET /repos/{repo_id}/prs endpoint."""
 
-    def test_list_prs(self, client, mock_repo_info, mock_pr_data):
-        """Test listing PRs for a repo."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-            mock_client.list_prs.return_value = [mock_pr_data]
-
-            response = client.get("/repos/1/prs")
+    @pytest.mark.parametrize("params, expected_call", [
+        (
+            {},
+            dict(state="open", search_query=None, sort="created", order="desc",
+                 page=1, per_page=30),
+        ),
+        (
+            {"state": "closed", "per_page": 50},
+            dict(state="closed", search_query=None, sort="created", order="desc",
+                 page=1, per_page=50),
+        ),
+    ], ids=["defaults", "with_state_filter"])
+    def test_list_prs(self, client, mocks, mock_repo_info, mock_pr_data, params, expected_call):
+        """Test listing PRs, with and without a state filter."""
+        mocks["get_repo_or_404"].return_value = mock_repo_info
+        mocks["github_client"].list_prs.return_value = ([mock_pr_data], 1)
+
+        response = client.get("/repos/1/prs", params=params)
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 1
-        assert data[0]["number"] == 123
-        assert data[0]["head_ref"] == "feature/test"
-        assert data[0]["base_ref"] == "main"
-
-    def test_list_prs_with_state_filter(self, client, mock_repo_info, mock_pr_data):
-        """Test listing PRs with state filter."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-            mock_client.list_prs.return_value = [mock_pr_data]
-
-            response = client.get("/repos/1/prs?state=closed&limit=50")
-
-        assert response.status_code == 200
-        mock_client.list_prs.assert_called_once_with(
-            "test-owner",
-            "test-repo",
-            state="closed",
-            limit=50,
+        assert data["total"] == 1
+        assert len(data["prs"]) == 1
+        assert data["prs"][0]["number"] == 123
+        assert data["prs"][0]["head_ref"] == "feature/test"
+        assert data["prs"][0]["base_ref"] == "main"
+        mocks["github_client"].list_prs.assert_called_once_with(
+            "test-owner", "test-repo", **expected_call
         )
 
 
 class TestLabelsAndAssignees:
     """Tests for labels and assignees endpoints."""
 
-    def test_get_labels(self, client, mock_repo_info):
+    def test_get_labels(self, client, mocks, mock_repo_info):
         """Test getting available labels."""
         mock_labels = [
             {"name": "bug", "color": "d73a4a", "description": "Something isn't working"},
             {"name": "enhancement", "color": "a2eeef", "description": "New feature"},
         ]
 
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-            mock_client.get_available_labels.return_value = mock_labels
+        mocks["get_repo_or_404"].return_value = mock_repo_info
+        mocks["github_client"].get_available_labels.return_value = mock_labels
 
-            response = client.get("/repos/1/labels")
+        response = client.get("/repos/1/labels")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["labels"]) == 2
         assert data["labels"][0]["name"] == "bug"
 
-    def test_get_assignees(self, client, mock_repo_info):
+    def test_get_assignees(self, client, mocks, mock_repo_info):
         """Test getting assignable users."""
-        with patch("app.routers.github.get_repo_or_404") as mock_get, \
-             patch("app.routers.github.github_client") as mock_client:
-            mock_get.return_value = mock_repo_info
-            mock_client.get_assignable_users.return_value = ["user1", "user2"]
+        mocks["get_repo_or_404"].return_value = mock_repo_info
+        mocks["github_client"].get_assignable_users.return_value = ["user1", "user2"]
 
-            response = client.get("/repos/1/assignees")
+        response = client.get("/repos/1/assignees")
 
         assert response.status_code == 200
         data = response.json()
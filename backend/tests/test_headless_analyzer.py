@@ -1,18 +1,135 @@
 """Tests for headless_analyzer.py."""
 
+import copy
+import importlib
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock
 import asyncio
 
+import app.cli.claude_adapter as _claude_adapter
+from app.cli import CLIType, get_adapter
+from app.services.headless_analyzer import (
+    HeadlessAnalyzer,
+    SessionMessage,
+    SessionResult,
+    headless_analyzer,
+)
+
+# The module itself; app.services re-exports the headless_analyzer instance
+# under the same name, so a plain `import ... as` would bind the instance
+_headless = importlib.import_module("app.services.headless_analyzer")
+
+
+# Plain-object stand-in for the settings the Claude adapter reads; copied per
+# test so tests can override fields without building a MagicMock each time
+_SETTINGS_PROTOTYPE = SimpleNamespace(
+    claude_command="claude",
+    claude_permission_mode="acceptEdits",
+    claude_max_turns=10,
+    claude_model="sonnet",
+    get_allowed_tools=lambda: ["Read", "Glob"],
+    get_disallowed_tools=lambda: [],
+)
+
+
+@pytest.fixture
+def mock_settings():
+    """Per-test copy of the settings prototype."""
+    return copy.copy(_SETTINGS_PROTOTYPE)
+
+
+def _flag_values(cmd: list[str]) -> dict[str, str]:
+    """Map each option in a command line to the token that follows it."""
+    return {token: value for token, value in zip(cmd, cmd[1:]) if token.startswith("-")}
+
+
+def _make_readline(lines):
+    """readline() stand-in that returns each of ``lines`` and then b'' (EOF)."""
+    async def lines_then_eof():
+        for line in lines:
+            yield line
+        yield b''
+
+    return lines_then_eof().__anext__
+
+
+def _async_return(value):
+    """Coroutine function returning ``value``; a cheap stand-in for AsyncMock."""
+    async def stub(*args, **kwargs):
+        return value
+
+    return stub
+
+
+def _fake_process(lines=(), returncode=0, stderr=b''):
+    """Stand-in for the asyncio subprocess analyze_stream reads from."""
+    return SimpleNamespace(
+        returncode=returncode,
+        wait=_async_return(None),
+        stdout=SimpleNamespace(readline=_make_readline(lines)),
+        stderr=SimpleNamespace(read=_async_return(stderr)),
+    )
+
+
+def _stream_of(*messages):
+    """analyze_stream stand-in that yields the given, already built, messages."""
+    async def stream(*args, **kwargs):
+        for msg in messages:
+            yield msg
+
+    return stream
+
+
+@pytest.fixture(scope="module")
+def shared_analyzer():
+    """HeadlessAnalyzer for tests that never touch its running-session state."""
+    return HeadlessAnalyzer()
+
+
+@pytest.fixture(scope="module")
+def adapter():
+    """The stateless Claude adapter analyze_stream uses to build the command."""
+    return get_adapter(CLIType.CLAUDE)
+
+
+# Minimal and fully populated dataclasses, built once at import; the tests
+# only read them
+_DEFAULT_MSG = SessionMessage(type="assistant")
+
+_MINIMAL_RESULT = SessionResult(session_id="test-123", result="Done", success=True)
+
+_FULL_MSG = SessionMessage(
+    type="result",
+    subtype="success",
+    content="Analysis complete",
+    session_id="abc-123",
+    cost_usd=0.05,
+    duration_ms=5000,
+    raw={"key": "value"},
+)
+
+_FULL_RESULT = SessionResult(
+    session_id="full-test",
+    result="Analysis complete",
+    success=True,
+    cost_usd=0.12,
+    duration_ms=15000,
+    turns=3,
+    messages=[
+        SessionMessage(type="system", subtype="init"),
+        SessionMessage(type="assistant", content="Working..."),
+        SessionMessage(type="result", subtype="success", content="Done"),
+    ],
+)
+
 
 class TestSessionMessage:
     """Tests for SessionMessage dataclass."""
 
     def test_default_values(self):
         """Test SessionMessage with minimal required fields."""
-        from app.services.headless_analyzer import SessionMessage
-
-        msg = SessionMessage(type="assistant")
+        msg = _DEFAULT_MSG
 
         assert msg.type == "assistant"
         assert msg.subtype is None
@@ -24,18 +141,7 @@ class TestSessionMessage:
 
     def test_full_initialization(self):
         """Test SessionMessage with all fields."""
-        from app.services.headless_analyzer import SessionMessage
-
-        raw_data = {"key": "value"}
-        msg = SessionMessage(
-            type="result",
-            subtype="success",
-            content="Analysis complete",
-            session_id="abc-123",
-            cost_usd=0.05,
-            duration_ms=5000,
-            raw=raw_data,
-        )
+        msg = _FULL_MSG
 
         assert msg.type == "result"
         assert msg.subtype == "success"
@@ -43,7 +149,7 @@ class TestSessionMessage:
         assert msg.session_id == "abc-123"
         assert msg.cost_usd == 0.05
         assert msg.duration_ms == 5000
-        assert msg.raw == raw_data
+        assert msg.raw == {"key": "value"}
 
 
 class TestSessionResult:
@@ -51,13 +157,7 @@ class TestSessionResult:
 
     def test_minimal_success_result(self):
         """Test minimal successful SessionResult."""
-        from app.services.headless_analyzer import SessionResult
-
-        result = SessionResult(
-            session_id="test-123",
-            result="Done",
-            success=True,
-        )
+        result = _MINIMAL_RESULT
 
         assert result.session_id == "test-123"
         assert result.result == "Done"
@@ -70,8 +170,6 @@ class TestSessionResult:
 
     def test_error_result(self):
         """Test SessionResult with error."""
-        from app.services.headless_analyzer import SessionResult
-
         result = SessionResult(
             session_id="",
             result="",
@@ -84,23 +182,7 @@ class TestSessionResult:
 
     def test_full_result(self):
         """Test SessionResult with all fields populated."""
-        from app.services.headless_analyzer import SessionResult, SessionMessage
-
-        messages = [
-            SessionMessage(type="system", subtype="init"),
-            SessionMessage(type="assistant", content="Working..."),
-            SessionMessage(type="result", subtype="success", content="Done"),
-        ]
-
-        result = SessionResult(
-            session_id="full-test",
-            result="Analysis complete",
-            success=True,
-            cost_usd=0.12,
-            duration_ms=15000,
-            turns=3,
-            messages=messages,
-        )
+        result = _FULL_RESULT
 
         assert result.cost_usd == 0.12
         assert result.duration_ms == 15000
@@ -109,31 +191,16 @@ class TestSessionResult:
 
 
 class TestHeadlessAnalyzerBuildCommand:
-    """Tests for HeadlessAnalyzer._build_command method."""
+    """Tests for the Claude command line HeadlessAnalyzer launches by default."""
 
-    @pytest.fixture
-    def analyzer(self):
-        """Create HeadlessAnalyzer instance."""
-        from app.services.headless_analyzer import HeadlessAnalyzer
-        return HeadlessAnalyzer()
+    @pytest.fixture(autouse=True)
+    def _patch_settings(self, monkeypatch, mock_settings):
+        """Serve mock_settings to the adapter; tests adjust it before building."""
+        monkeypatch.setattr(_claude_adapter, "settings", mock_settings)
 
-    @pytest.fixture
-    def mock_settings(self):
-        """Create mock settings."""
-        settings = MagicMock()
-        settings.claude_command = "claude"
-        settings.claude_output_format = "stream-json"
-        settings.claude_permission_mode = "acceptEdits"
-        settings.claude_max_turns = 10
-        settings.claude_model = "sonnet"
-        settings.get_allowed_tools.return_value = ["Read", "Glob"]
-        settings.get_disallowed_tools.return_value = []
-        return settings
-
-    def test_basic_command(self, analyzer, mock_settings):
+    def test_basic_command(self, adapter):
         """Test basic command building."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test prompt", "/home/user/project")
+        cmd = adapter.build_headless_command("Test prompt", "/home/user/project")
 
         assert cmd[0] == "claude"
         assert "-p" in cmd
@@ -141,196 +208,77 @@ class TestHeadlessAnalyzerBuildCommand:
         assert "--output-format" in cmd
         assert "stream-json" in cmd
 
-    def test_permission_mode_accept_edits(self, analyzer, mock_settings):
-        """Test acceptEdits permission mode."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path")
-
-        assert "--permission-mode" in cmd
-        idx = cmd.index("--permission-mode")
-        assert cmd[idx + 1] == "acceptEdits"
-
-    def test_permission_mode_bypass(self, analyzer, mock_settings):
+    def test_permission_mode_bypass(self, adapter, mock_settings):
         """Test bypassPermissions mode."""
         mock_settings.claude_permission_mode = "bypassPermissions"
 
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path")
+        cmd = adapter.build_headless_command("Test", "/path")
 
         assert "--dangerously-skip-permissions" in cmd
         assert "--permission-mode" not in cmd
 
-    def test_permission_mode_plan(self, analyzer, mock_settings):
-        """Test plan permission mode."""
-        mock_settings.claude_permission_mode = "plan"
-
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path")
-
-        assert "--permission-mode" in cmd
-        idx = cmd.index("--permission-mode")
-        assert cmd[idx + 1] == "plan"
-
-    def test_session_id_option(self, analyzer, mock_settings):
-        """Test adding session_id."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path", session_id="my-session-id")
-
-        assert "--session-id" in cmd
-        idx = cmd.index("--session-id")
-        assert cmd[idx + 1] == "my-session-id"
-
-    def test_resume_session_option(self, analyzer, mock_settings):
-        """Test resuming a session."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path", resume_session="prev-session")
-
-        assert "--resume" in cmd
-        idx = cmd.index("--resume")
-        assert cmd[idx + 1] == "prev-session"
-
-    def test_allowed_tools(self, analyzer, mock_settings):
-        """Test allowed tools are included."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path")
-
-        assert "--allowedTools" in cmd
-        idx = cmd.index("--allowedTools")
-        assert cmd[idx + 1] == "Read,Glob"
-
-    def test_allowed_tools_override(self, analyzer, mock_settings):
-        """Test overriding allowed tools."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command(
-                "Test", "/path",
-                allowed_tools=["Bash", "Write"]
-            )
-
-        assert "--allowedTools" in cmd
-        idx = cmd.index("--allowedTools")
-        assert cmd[idx + 1] == "Bash,Write"
-
-    def test_disallowed_tools(self, analyzer, mock_settings):
-        """Test disallowed tools are included."""
-        mock_settings.get_disallowed_tools.return_value = ["Edit", "Bash"]
-
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path")
-
-        assert "--disallowedTools" in cmd
-        idx = cmd.index("--disallowedTools")
-        assert cmd[idx + 1] == "Edit,Bash"
-
-    def test_max_turns(self, analyzer, mock_settings):
-        """Test max turns setting."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path")
-
-        assert "--max-turns" in cmd
-        idx = cmd.index("--max-turns")
-        assert cmd[idx + 1] == "10"
-
-    def test_max_turns_override(self, analyzer, mock_settings):
-        """Test overriding max turns."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path", max_turns=5)
-
-        assert "--max-turns" in cmd
-        idx = cmd.index("--max-turns")
-        assert cmd[idx + 1] == "5"
-
-    def test_max_turns_zero_excluded(self, analyzer, mock_settings):
-        """Test that max_turns=0 is excluded (unlimited)."""
-        mock_settings.claude_max_turns = 0
-
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path")
-
-        assert "--max-turns" not in cmd
-
-    def test_model_setting(self, analyzer, mock_settings):
-        """Test model setting."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path")
-
-        assert "--model" in cmd
-        idx = cmd.index("--model")
-        assert cmd[idx + 1] == "sonnet"
-
-    def test_model_override(self, analyzer, mock_settings):
-        """Test overriding model."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command("Test", "/path", model="opus")
-
-        assert "--model" in cmd
-        idx = cmd.index("--model")
-        assert cmd[idx + 1] == "opus"
-
-    def test_system_prompt(self, analyzer, mock_settings):
-        """Test adding system prompt."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command(
-                "Test", "/path",
-                system_prompt="You are a code reviewer."
-            )
-
-        assert "--append-system-prompt" in cmd
-        idx = cmd.index("--append-system-prompt")
-        assert cmd[idx + 1] == "You are a code reviewer."
-
-    def test_output_format_override(self, analyzer, mock_settings):
-        """Test overriding output format."""
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            cmd = analyzer._build_command(
-                "Test", "/path",
-                output_format="json"
-            )
-
-        assert "--output-format" in cmd
-        idx = cmd.index("--output-format")
-        assert cmd[idx + 1] == "json"
-
-
-class TestHeadlessAnalyzerParseMessage:
-    """Tests for HeadlessAnalyzer._parse_message method."""
-
-    @pytest.fixture
-    def analyzer(self):
-        """Create HeadlessAnalyzer instance."""
-        from app.services.headless_analyzer import HeadlessAnalyzer
-        return HeadlessAnalyzer()
-
-    def test_parse_system_message(self, analyzer):
-        """Test parsing system init message."""
-        data = {
-            "type": "system",
-            "subtype": "init",
-            "session_id": "abc-123",
-        }
-
-        msg = analyzer._parse_message(data)
-
-        assert msg.type == "system"
-        assert msg.subtype == "init"
-        assert msg.session_id == "abc-123"
-
-    def test_parse_assistant_message_string_content(self, analyzer):
-        """Test parsing assistant message with string content."""
-        data = {
-            "type": "assistant",
-            "message": {
-                "content": "Hello, I can help you."
-            },
-        }
-
-        msg = analyzer._parse_message(data)
-
-        assert msg.type == "assistant"
-        assert msg.content == "Hello, I can help you."
-
-    def test_parse_assistant_message_list_content(self, analyzer):
-        """Test parsing assistant message with list of content blocks."""
-        data = {
+    @pytest.mark.parametrize("overrides, kwargs, flag, expected", [
+        pytest.param({}, {}, "--permission-mode", "acceptEdits",
+                     id="permission_mode_accept_edits"),
+        pytest.param({"claude_permission_mode": "plan"}, {}, "--permission-mode", "plan",
+                     id="permission_mode_plan"),
+        pytest.param({}, {"session_id": "my-session-id"}, "--session-id", "my-session-id",
+                     id="session_id"),
+        pytest.param({}, {"resume_session": "prev-session"}, "--resume", "prev-session",
+                     id="resume_session"),
+        pytest.param({}, {}, "--allowedTools", "Read,Glob",
+                     id="allowed_tools"),
+        pytest.param({}, {"allowed_tools": ["Bash", "Write"]}, "--allowedTools", "Bash,Write",
+                     id="allowed_tools_override"),
+        pytest.param({"get_disallowed_tools": lambda: ["Edit", "Bash"]}, {},
+                     "--disallowedTools", "Edit,Bash",
+                     id="disallowed_tools"),
+        pytest.param({}, {}, "--max-turns", "10",
+                     id="max_turns"),
+        pytest.param({}, {"max_turns": 5}, "--max-turns", "5",
+                     id="max_turns_override"),
+        pytest.param({"claude_max_turns": 0}, {}, "--max-turns", None,
+                     id="max_turns_zero_excluded"),
+        pytest.param({}, {}, "--model", "sonnet",
+                     id="model"),
+        pytest.param({}, {"model": "opus"}, "--model", "opus",
+                     id="model_override"),
+        pytest.param({}, {"system_prompt": "You are a code reviewer."},
+                     "--append-system-prompt", "You are a code reviewer.",
+                     id="system_prompt"),
+        pytest.param({}, {"output_format": "json"}, "--output-format", "json",
+                     id="output_format_override"),
+    ])
+    def test_flag_value(self, adapter, mock_settings, overrides, kwargs, flag, expected):
+        """Test the value following each flag; ``expected=None`` means the flag is omitted."""
+        vars(mock_settings).update(overrides)
+
+        cmd = adapter.build_headless_command("Test", "/path", **kwargs)
+
+        assert _flag_values(cmd).get(flag) == expected
+
+
+_UNKNOWN_DATA = {"custom_field": "value"}
+_EXTRA_FIELDS_DATA = {
+    "type": "assistant",
+    "extra_field": "extra_value",
+    "nested": {"a": 1},
+}
+
+# (stream-json payload, SessionMessage attributes expected after parsing)
+_PARSE_CASES = [
+    pytest.param(
+        {"type": "system", "subtype": "init", "session_id": "abc-123"},
+        {"type": "system", "subtype": "init", "session_id": "abc-123"},
+        id="system_message",
+    ),
+    pytest.param(
+        {"type": "assistant", "message": {"content": "Hello, I can help you."}},
+        {"type": "assistant", "content": "Hello, I can help you."},
+        id="assistant_message_string_content",
+    ),
+    pytest.param(
+        {
             "type": "assistant",
             "message": {
                 "content": [
@@ -339,67 +287,57 @@ class TestHeadlessAnalyzerParseMessage:
                     {"type": "tool_use", "name": "Read"},
                 ]
             },
-        }
-
-        msg = analyzer._parse_message(data)
-
-        assert msg.type == "assistant"
-        assert msg.content == "First part.  Second part."
-
-    def test_parse_result_success(self, analyzer):
-        """Test parsing successful result message."""
-        data = {
+        },
+        {"type": "assistant", "content": "First part.  Second part."},
+        id="assistant_message_list_content",
+    ),
+    pytest.param(
+        {
             "type": "result",
             "subtype": "success",
             "result": "Analysis complete: no issues found.",
             "session_id": "result-123",
             "total_cost_usd": 0.05,
             "duration_ms": 3000,
-        }
-
-        msg = analyzer._parse_message(data)
-
-        assert msg.type == "result"
-        assert msg.subtype == "success"
-        assert msg.content == "Analysis complete: no issues found."
-        assert msg.session_id == "result-123"
-        assert msg.cost_usd == 0.05
-        assert msg.duration_ms == 3000
-
-    def test_parse_error_message(self, analyzer):
-        """Test parsing error message."""
-        data = {
-            "type": "error",
-            "subtype": "error",
-        }
-
-        msg = analyzer._parse_message(data)
-
-        assert msg.type == "error"
-        assert msg.subtype == "error"
-
-    def test_parse_unknown_message(self, analyzer):
-        """Test parsing unknown message type."""
-        data = {
-            "custom_field": "value",
-        }
-
-        msg = analyzer._parse_message(data)
+        },
+        {
+            "type": "result",
+            "subtype": "success",
+            "content": "Analysis complete: no issues found.",
+            "session_id": "result-123",
+            "cost_usd": 0.05,
+            "duration_ms": 3000,
+        },
+        id="result_success",
+    ),
+    pytest.param(
+        {"type": "error", "subtype": "error"},
+        {"type": "error", "subtype": "error"},
+        id="error_message",
+    ),
+    pytest.param(
+        _UNKNOWN_DATA,
+        {"type": "unknown", "raw": _UNKNOWN_DATA},
+        id="unknown_message",
+    ),
+    pytest.param(
+        _EXTRA_FIELDS_DATA,
+        {"raw": _EXTRA_FIELDS_DATA},
+        id="raw_data_preserved",
+    ),
+]
 
-        assert msg.type == "unknown"
-        assert msg.raw == data
 
-    def test_raw_data_preserved(self, analyzer):
-        """Test that raw data is always preserved."""
-        data = {
-            "type": "assistant",
-            "extra_field": "extra_value",
-            "nested": {"a": 1},
-        }
+class TestHeadlessAnalyzerParseMessage:
+    """Tests for HeadlessAnalyzer._parse_message method."""
 
-        msg = analyzer._parse_message(data)
+    @pytest.mark.parametrize("data, expected", _PARSE_CASES)
+    def test_parse_message(self, shared_analyzer, data, expected):
+        """Test the fields parsed from each kind of stream-json message."""
+        msg = shared_analyzer._parse_message(data)
 
-        assert msg.raw == data
+        for name, value in expected.items():
+            assert getattr(msg, name) == value, name
 
 
 class TestHeadlessAnalyzerRunningSessionsManagement:
@@ -408,7 +346,6 @@ class TestHeadlessAnalyzerRunningSessionsManagement:
     @pytest.fixture
     def analyzer(self):
         """Create HeadlessAnalyzer instance."""
-        from app.services.headless_analyzer import HeadlessAnalyzer
         return HeadlessAnalyzer()
 
     def test_list_running_empty(self, analyzer):
@@ -417,8 +354,8 @@ class TestHeadlessAnalyzerRunningSessionsManagement:
 
     def test_list_running_with_sessions(self, analyzer):
         """Test list_running with sessions."""
-        analyzer._running_sessions["session-1"] = MagicMock()
-        analyzer._running_sessions["session-2"] = MagicMock()
+        analyzer._running_sessions["session-1"] = None
+        analyzer._running_sessions["session-2"] = None
 
         running = analyzer.list_running()
 
@@ -452,7 +389,7 @@ class TestHeadlessAnalyzerRunningSessionsManagement:
     def test_list_running_combines_both_tracking_mechanisms(self, analyzer):
         """Test that list_running combines _running_sessions and _active_session_ids."""
         # Add session via subprocess tracking
-        analyzer._running_sessions["process-session"] = MagicMock()
+        analyzer._running_sessions["process-session"] = None
         # Add session via explicit registration
         analyzer.register_running("registered-session")
 
@@ -465,7 +402,7 @@ class TestHeadlessAnalyzerRunningSessionsManagement:
     def test_list_running_deduplicates_sessions(self, analyzer):
         """Test that list_running deduplicates sessions in both tracking mechanisms."""
         # Add same session to both tracking mechanisms
-        analyzer._running_sessions["shared-session"] = MagicMock()
+        analyzer._running_sessions["shared-session"] = None
         analyzer._active_session_ids.add("shared-session")
 
         running = analyzer.list_running()
@@ -480,21 +417,16 @@ class TestHeadlessAnalyzerCancel:
     @pytest.fixture
     def analyzer(self):
         """Create HeadlessAnalyzer instance."""
-        from app.services.headless_analyzer import HeadlessAnalyzer
         return HeadlessAnalyzer()
 
-    @pytest.mark.asyncio
     async def test_cancel_nonexistent_session(self, analyzer):
         """Test canceling a session that doesn't exist."""
         result = await analyzer.cancel("nonexistent")
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_cancel_existing_session(self, analyzer):
         """Test canceling an existing session."""
-        mock_process = MagicMock()
-        mock_process.terminate = MagicMock()
-        mock_process.wait = AsyncMock()
+        mock_process = SimpleNamespace(terminate=MagicMock(), wait=AsyncMock())
 
         analyzer._running_sessions["test-session"] = mock_process
 
@@ -504,17 +436,15 @@ class TestHeadlessAnalyzerCancel:
         mock_process.terminate.assert_called_once()
         mock_process.wait.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_cancel_timeout_falls_back_to_kill(self, analyzer):
+    async def test_cancel_timeout_falls_back_to_kill(self, analyzer, monkeypatch):
         """Test that cancel falls back to kill on timeout."""
-        mock_process = MagicMock()
-        mock_process.terminate = MagicMock()
-        mock_process.kill = MagicMock()
+        monkeypatch.setattr(_headless, "CANCEL_TERMINATE_TIMEOUT_SECS", 0.01)
 
         async def slow_wait():
-            await asyncio.sleep(10)
+            # Never finishes; cancel() gives up after the patched timeout
+            await asyncio.Event().wait()
 
-        mock_process.wait = slow_wait
+        mock_process = SimpleNamespace(terminate=MagicMock(), kill=MagicMock(), wait=slow_wait)
         analyzer._running_sessions["slow-session"] = mock_process
 
         result = await analyzer.cancel("slow-session")
@@ -530,24 +460,21 @@ class TestHeadlessAnalyzerAnalyzeStream:
     @pytest.fixture
     def analyzer(self):
         """Create HeadlessAnalyzer instance."""
-        from app.services.headless_analyzer import HeadlessAnalyzer
         return HeadlessAnalyzer()
 
-    @pytest.fixture
-    def mock_settings(self):
-        """Create mock settings."""
-        settings = MagicMock()
-        settings.claude_command = "claude"
-        settings.claude_output_format = "stream-json"
-        settings.claude_permission_mode = "acceptEdits"
-        settings.claude_max_turns = 10
-        settings.claude_model = "sonnet"
-        settings.get_allowed_tools.return_value = []
-        settings.get_disallowed_tools.return_value = []
-        return settings
-
-    @pytest.mark.asyncio
-    async def test_analyze_stream_success(self, analyzer, mock_settings):
+    @pytest.fixture(autouse=True)
+    def spawned(self, monkeypatch, mock_settings):
+        """Holder for the process create_subprocess_exec returns; tests set ``.process``."""
+        spawned = SimpleNamespace(process=None)
+
+        async def create_subprocess_exec(*args, **kwargs):
+            return spawned.process
+
+        monkeypatch.setattr(_claude_adapter, "settings", mock_settings)
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+        return spawned
+
+    async def test_analyze_stream_success(self, analyzer, spawned):
         """Test successful streaming analysis."""
         json_output = [
             b'{"type": "system", "subtype": "init"}\n',
@@ -555,128 +482,66 @@ class TestHeadlessAnalyzerAnalyzeStream:
             b'{"type": "result", "subtype": "success", "result": "Done"}\n',
         ]
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.wait = AsyncMock()
-
-        async def readline_generator():
-            for line in json_output:
-                yield line
-            yield b''
-
-        gen = readline_generator()
-        mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = lambda: gen.__anext__()
-        mock_process.stderr = MagicMock()
-        mock_process.stderr.read = AsyncMock(return_value=b'')
+        spawned.process = _fake_process(json_output)
 
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_process)):
-                messages = []
-                async for msg in analyzer.analyze_stream("Test", "/path"):
-                    messages.append(msg)
+        messages = []
+        async for msg in analyzer.analyze_stream("Test", "/path"):
+            messages.append(msg)
 
         assert len(messages) == 3
         assert messages[0].type == "system"
         assert messages[1].type == "assistant"
         assert messages[2].type == "result"
 
-    @pytest.mark.asyncio
-    async def test_analyze_stream_non_json_output(self, analyzer, mock_settings):
+    async def test_analyze_stream_non_json_output(self, analyzer, spawned):
         """Test handling non-JSON output gracefully."""
         output = [
             b'Not valid JSON\n',
             b'{"type": "result", "subtype": "success"}\n',
         ]
 
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.wait = AsyncMock()
+        spawned.process = _fake_process(output)
 
-        async def readline_generator():
-            for line in output:
-                yield line
-            yield b''
-
-        gen = readline_generator()
-        mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = lambda: gen.__anext__()
-        mock_process.stderr = MagicMock()
-        mock_process.stderr.read = AsyncMock(return_value=b'')
-
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_process)):
-                messages = []
-                async for msg in analyzer.analyze_stream("Test", "/path"):
-                    messages.append(msg)
+        messages = []
+        async for msg in analyzer.analyze_stream("Test", "/path"):
+            messages.append(msg)
 
         assert len(messages) == 2
         assert messages[0].type == "text"
         assert "Not valid JSON" in messages[0].content
         assert messages[1].type == "result"
 
-    @pytest.mark.asyncio
-    async def test_analyze_stream_error_output(self, analyzer, mock_settings):
+    async def test_analyze_stream_error_output(self, analyzer, spawned):
         """Test handling stderr output on non-zero exit."""
-        mock_process = MagicMock()
-        mock_process.returncode = 1
-        mock_process.wait = AsyncMock()
-
-        async def readline_generator():
-            yield b''
+        spawned.process = _fake_process(returncode=1, stderr=b'Error: command not found')
 
-        gen = readline_generator()
-        mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = lambda: gen.__anext__()
-        mock_process.stderr = MagicMock()
-        mock_process.stderr.read = AsyncMock(return_value=b'Error: command not found')
-
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_process)):
-                messages = []
-                async for msg in analyzer.analyze_stream("Test", "/path"):
-                    messages.append(msg)
+        messages = []
+        async for msg in analyzer.analyze_stream("Test", "/path"):
+            messages.append(msg)
 
         assert len(messages) == 1
         assert messages[0].type == "error"
         assert "Error: command not found" in messages[0].content
 
-    @pytest.mark.asyncio
-    async def test_analyze_stream_cleans_up_session(self, analyzer, mock_settings):
+    async def test_analyze_stream_cleans_up_session(self, analyzer, spawned):
         """Test that session is removed from running sessions after completion."""
-        mock_process = MagicMock()
-        mock_process.returncode = 0
-        mock_process.wait = AsyncMock()
+        spawned.process = _fake_process()
 
-        async def readline_generator():
-            yield b''
-
-        gen = readline_generator()
-        mock_process.stdout = MagicMock()
-        mock_process.stdout.readline = lambda: gen.__anext__()
-        mock_process.stderr = MagicMock()
-        mock_process.stderr.read = AsyncMock(return_value=b'')
-
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_process)):
-                async for _ in analyzer.analyze_stream("Test", "/path", session_id="cleanup-test"):
-                    pass
+        async for _ in analyzer.analyze_stream("Test", "/path", session_id="cleanup-test"):
+            pass
 
         assert "cleanup-test" not in analyzer._running_sessions
 
-    @pytest.mark.asyncio
-    async def test_analyze_stream_stores_asyncio_process(self, analyzer, mock_settings):
+    async def test_analyze_stream_stores_asyncio_process(self, analyzer, spawned):
         """Test that analyze_stream stores asyncio.subprocess.Process, not subprocess.Popen.
 
         This test validates the type annotation: _running_sessions should store
         asyncio.subprocess.Process objects from asyncio.create_subprocess_exec,
         not subprocess.Popen from the synchronous subprocess module.
         """
-        import asyncio.subprocess as async_subprocess
-
-        mock_process = MagicMock(spec=async_subprocess.Process)
+        mock_process = MagicMock(spec=asyncio.subprocess.Process)
         mock_process.returncode = 0
-        mock_process.wait = AsyncMock()
+        mock_process.wait = _async_return(None)
 
         async def readline_generator():
             # Check the process type while it's stored in _running_sessions
@@ -690,12 +555,12 @@ class TestHeadlessAnalyzerAnalyzeStream:
         mock_process.stdout = MagicMock()
         mock_process.stdout.readline = lambda: gen.__anext__()
         mock_process.stderr = MagicMock()
-        mock_process.stderr.read = AsyncMock(return_value=b'')
+        mock_process.stderr.read = _async_return(b'')
+
+        spawned.process = mock_process
 
-        with patch("app.services.headless_analyzer.settings", mock_settings):
-            with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_process)):
-                async for _ in analyzer.analyze_stream("Test", "/path", session_id="type-check-session"):
-                    pass
+        async for _ in analyzer.analyze_stream("Test", "/path", session_id="type-check-session"):
+            pass
 
 
 class TestHeadlessAnalyzerAnalyze:
@@ -703,29 +568,25 @@ class TestHeadlessAnalyzerAnalyze:
 
     @pytest.fixture
     def analyzer(self):
-        """Create HeadlessAnalyzer instance."""
-        from app.services.headless_analyzer import HeadlessAnalyzer
+        """Create HeadlessAnalyzer instance; tests replace its analyze_stream."""
         return HeadlessAnalyzer()
 
-    @pytest.mark.asyncio
     async def test_analyze_returns_success_result(self, analyzer):
         """Test analyze returns successful SessionResult."""
-        from app.services.headless_analyzer import SessionMessage
-
-        async def mock_stream(*args, **kwargs):
-            yield SessionMessage(type="system", subtype="init")
-            yield SessionMessage(type="assistant", content="Working...")
-            yield SessionMessage(
+        analyzer.analyze_stream = _stream_of(
+            SessionMessage(type="system", subtype="init"),
+            SessionMessage(type="assistant", content="Working..."),
+            SessionMessage(
                 type="result",
                 subtype="success",
                 content="Analysis complete",
                 session_id="test-session",
                 cost_usd=0.05,
                 duration_ms=2000,
-            )
+            ),
+        )
 
-        with patch.object(analyzer, "analyze_stream", mock_stream):
-            result = await analyzer.analyze("Test prompt", "/path")
+        result = await analyzer.analyze("Test prompt", "/path")
 
         assert result.success is True
         assert result.session_id == "test-session"
@@ -734,31 +595,23 @@ class TestHeadlessAnalyzerAnalyze:
         assert result.duration_ms == 2000
         assert len(result.messages) == 3
 
-    @pytest.mark.asyncio
     async def test_analyze_returns_error_result(self, analyzer):
         """Test analyze returns error SessionResult."""
-        from app.services.headless_analyzer import SessionMessage
-
-        async def mock_stream(*args, **kwargs):
-            yield SessionMessage(type="system", subtype="init")
-            yield SessionMessage(type="error", content="Claude error occurred")
+        analyzer.analyze_stream = _stream_of(
+            SessionMessage(type="system", subtype="init"),
+            SessionMessage(type="error", content="Claude error occurred"),
+        )
 
-        with patch.object(analyzer, "analyze_stream", mock_stream):
-            result = await analyzer.analyze("Test prompt", "/path")
+        result = await analyzer.analyze("Test prompt", "/path")
 
         assert result.success is False
         assert result.error == "Claude error occurred"
 
-    @pytest.mark.asyncio
     async def test_analyze_unknown_error(self, analyzer):
         """Test analyze with no result or error message."""
-        from app.services.headless_analyzer import SessionMessage
+        analyzer.analyze_stream = _stream_of(SessionMessage(type="system", subtype="init"))
 
-        async def mock_stream(*args, **kwargs):
-            yield SessionMessage(type="system", subtype="init")
-
-        with patch.object(analyzer, "analyze_stream", mock_stream):
-            result = await analyzer.analyze("Test prompt", "/path")
+        result = await analyzer.analyze("Test prompt", "/path")
 
         assert result.success is False
         assert result.error == "Unknown error"
@@ -769,7 +622,5 @@ class TestGlobalAnalyzerInstance:
 
     def test_global_instance_exists(self):
         """Test that global instance is created."""
-        from app.services.headless_analyzer import headless_analyzer, HeadlessAnalyzer
-
         assert headless_analyzer is not None
         assert isinstance(headless_analyzer, HeadlessAnalyzer)
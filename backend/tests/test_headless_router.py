@@ -10,17 +10,54 @@ Tests cover:
 
 import pytest
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi.testclient import TestClient
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from httpx import ASGITransport, AsyncClient
 from fastapi import FastAPI
 
+import app.routers.headless as _headless
 from app.routers.headless import router, HeadlessSessionCreate, HeadlessSessionResponse
 from app.services.headless_analyzer import SessionResult, SessionMessage
 from app.models import SessionStatus
 
 
-@pytest.fixture
+def _encode(payload):
+    """Serialize a request body once at import so each test posts the same bytes."""
+    return json.dumps(payload).encode()
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+_MINIMAL_BODY = _encode({"repo_id": 1, "prompt": "Hello"})
+_RUN_BODY = _encode({"repo_id": 1, "prompt": "Analyze the codebase", "title": "Code Analysis"})
+_CUSTOM_RUN_BODY = _encode({
+    "repo_id": 1,
+    "prompt": "Analyze the codebase",
+    "kind": "custom",
+    "title": "Code Analysis",
+})
+_ALL_OPTIONS_BODY = _encode({
+    "repo_id": 1,
+    "prompt": "Analyze the codebase",
+    "kind": "custom",
+    "title": "Code Analysis",
+    "permission_mode": "plan",
+    "allowed_tools": ["Read", "Write"],
+    "disallowed_tools": ["Bash"],
+    "max_turns": 10,
+    "model": "claude-3-opus",
+    "system_prompt": "Be concise",
+    "resume_session": "previous-session-id",
+})
+_MISSING_REPO_BODY = _encode(
+    {"repo_id": 999, "prompt": "Analyze the codebase", "title": "Code Analysis"}
+)
+_STREAM_BODY = _encode({"repo_id": 1, "prompt": "Analyze", "title": "Analysis"})
+
+
+@pytest.fixture(scope="module")
 def app():
     """Create a test FastAPI app with the headless router."""
     app = FastAPI()
@@ -28,15 +65,16 @@ def app():
     return app
 
 
-@pytest.fixture
-def client(app):
-    """Create a test client."""
-    return TestClient(app)
+@pytest.fixture(scope="module")
+async def client(app):
+    """Async client that drives the app in-process; shared, as the router is stateless."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
 
 @pytest.fixture
-def mock_repo():
-    """Create a mock repository."""
+def repo_row():
+    """Repo registry row served by the shared repo_store fixture."""
     return {
         "id": 1,
         "owner": "testowner",
@@ -45,9 +83,9 @@ def mock_repo():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_session_result():
-    """Create a mock successful session result."""
+    """Create a mock successful session result; shared, as the router only reads it."""
     return SessionResult(
         session_id="abc123-def456",
         result="Analysis complete. Found 3 issues.",
@@ -70,9 +108,9 @@ def mock_session_result():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_failed_session_result():
-    """Create a mock failed session result."""
+    """Create a mock failed session result; shared, as the router only reads it."""
     return SessionResult(
         session_id="",
         result="",
@@ -85,201 +123,128 @@ def mock_failed_session_result():
     )
 
 
+@pytest.fixture
+def mock_analyzer(monkeypatch):
+    """MagicMock installed as the router's headless_analyzer."""
+    mock = MagicMock()
+    monkeypatch.setattr(_headless, "headless_analyzer", mock)
+    return mock
+
+
+@pytest.fixture
+def patched_deps(monkeypatch, repo_store, mock_analyzer):
+    """Patch the run endpoints' database, metadata sidecar and analyzer.
+
+    Returns a namespace with the mock ``db`` session and the mock ``analyzer``.
+    """
+    mock_db = AsyncMock()
+    mock_db.add = MagicMock()
+    mock_db.refresh = AsyncMock(side_effect=lambda s: setattr(s, "id", 1))
+    # Result of the select the stream endpoint runs to update the session
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = MagicMock()
+    mock_db.execute = AsyncMock(return_value=mock_result)
+
+    @asynccontextmanager
+    async def get_repo_db(local_path):
+        yield mock_db
+
+    monkeypatch.setattr(_headless, "get_repo_db", get_repo_db)
+    monkeypatch.setattr(_headless, "save_session_metadata", lambda *args: None)
+    return SimpleNamespace(db=mock_db, analyzer=mock_analyzer)
+
+
 class TestRunHeadlessSession:
     """Tests for POST /headless/run endpoint."""
 
-    def test_run_headless_success(self, client, mock_repo, mock_session_result):
-        """Test running a headless session successfully."""
-        with patch("app.routers.headless.get_repo_or_404", return_value=mock_repo), \
-             patch("app.routers.headless.get_repo_db") as mock_db_ctx, \
-             patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-
-            # Mock database context manager
-            mock_db = AsyncMock()
-            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=None)
-
-            # Mock session creation
-            mock_session = MagicMock()
-            mock_session.id = 1
-            mock_db.add = MagicMock()
-            mock_db.commit = AsyncMock()
-            mock_db.refresh = AsyncMock(side_effect=lambda s: setattr(s, 'id', 1))
-
-            # Mock analyzer
-            mock_analyzer.analyze = AsyncMock(return_value=mock_session_result)
-
-            response = client.post(
-                "/headless/run",
-                json={
-                    "repo_id": 1,
-                    "prompt": "Analyze the codebase",
-                    "kind": "custom",
-                    "title": "Code Analysis",
-                }
-            )
+    @pytest.mark.parametrize("body, result_fixture, expected", [
+        pytest.param(
+            _CUSTOM_RUN_BODY,
+            "mock_session_result",
+            {
+                "result": "Analysis complete. Found 3 issues.",
+                "success": True,
+                "cost_usd": 0.05,
+                "duration_ms": 5000,
+                "error": None,
+            },
+            id="success",
+        ),
+        pytest.param(
+            _RUN_BODY,
+            "mock_failed_session_result",
+            {"success": False, "error": "Process exited with code 1"},
+            id="session_failed",
+        ),
+        pytest.param(
+            _MINIMAL_BODY,
+            "mock_session_result",
+            {"success": True},
+            id="default_values",
+        ),
+    ])
+    async def test_run_headless(
+        self, request, client, patched_deps, body, result_fixture, expected
+    ):
+        """Test the response for each analyzer outcome and request shape."""
+        patched_deps.analyzer.analyze = AsyncMock(
+            return_value=request.getfixturevalue(result_fixture)
+        )
+
+        response = await client.post("/headless/run", content=body, headers=_JSON_HEADERS)
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["session_id"] == 1
-            assert data["claude_session_id"] == "abc123-def456"
-            assert data["result"] == "Analysis complete. Found 3 issues."
-            assert data["success"] is True
-            assert data["cost_usd"] == 0.05
-            assert data["duration_ms"] == 5000
-            assert data["error"] is None
-
-    def test_run_headless_with_all_options(self, client, mock_repo, mock_session_result):
+        assert response.status_code == 200
+        data = response.json()
+        assert data["session_id"] == 1
+        # The router generates the session id up front and hands it to the analyzer
+        assert data["claude_session_id"] == patched_deps.analyzer.analyze.call_args[1]["session_id"]
+        for name, value in expected.items():
+            assert data[name] == value, name
+
+    async def test_run_headless_with_all_options(self, client, patched_deps, mock_session_result):
         """Test running a headless session with all optional parameters."""
-        with patch("app.routers.headless.get_repo_or_404", return_value=mock_repo), \
-             patch("app.routers.headless.get_repo_db") as mock_db_ctx, \
-             patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-
-            mock_db = AsyncMock()
-            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_db.add = MagicMock()
-            mock_db.commit = AsyncMock()
-            mock_db.refresh = AsyncMock(side_effect=lambda s: setattr(s, 'id', 1))
-
-            mock_analyzer.analyze = AsyncMock(return_value=mock_session_result)
-
-            response = client.post(
-                "/headless/run",
-                json={
-                    "repo_id": 1,
-                    "prompt": "Analyze the codebase",
-                    "kind": "custom",
-                    "title": "Code Analysis",
-                    "permission_mode": "plan",
-                    "allowed_tools": ["Read", "Write"],
-                    "disallowed_tools": ["Bash"],
-                    "max_turns": 10,
-                    "model": "claude-3-opus",
-                    "system_prompt": "Be concise",
-                    "resume_session": "previous-session-id",
-                }
-            )
+        patched_deps.analyzer.analyze = AsyncMock(return_value=mock_session_result)
 
-            assert response.status_code == 200
-
-            # Verify analyzer was called with all options
-            mock_analyzer.analyze.assert_called_once()
-            call_kwargs = mock_analyzer.analyze.call_args[1]
-            assert call_kwargs["permission_mode"] == "plan"
-            assert call_kwargs["allowed_tools"] == ["Read", "Write"]
-            assert call_kwargs["disallowed_tools"] == ["Bash"]
-            assert call_kwargs["max_turns"] == 10
-            assert call_kwargs["model"] == "claude-3-opus"
-            assert call_kwargs["system_prompt"] == "Be concise"
-            assert call_kwargs["resume_session"] == "previous-session-id"
-
-    def test_run_headless_session_failed(self, client, mock_repo, mock_failed_session_result):
-        """Test running a headless session that fails."""
-        with patch("app.routers.headless.get_repo_or_404", return_value=mock_repo), \
-             patch("app.routers.headless.get_repo_db") as mock_db_ctx, \
-             patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-
-            mock_db = AsyncMock()
-            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_db.add = MagicMock()
-            mock_db.commit = AsyncMock()
-            mock_db.refresh = AsyncMock(side_effect=lambda s: setattr(s, 'id', 1))
-
-            mock_analyzer.analyze = AsyncMock(return_value=mock_failed_session_result)
-
-            response = client.post(
-                "/headless/run",
-                json={
-                    "repo_id": 1,
-                    "prompt": "Analyze the codebase",
-                    "title": "Code Analysis",
-                }
-            )
+        response = await client.post(
+            "/headless/run", content=_ALL_OPTIONS_BODY, headers=_JSON_HEADERS
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["success"] is False
-            assert data["error"] == "Process exited with code 1"
+        assert response.status_code == 200
 
-    def test_run_headless_repo_not_found(self, client):
+        # Verify analyzer was called with all options
+        patched_deps.analyzer.analyze.assert_called_once()
+        call_kwargs = patched_deps.analyzer.analyze.call_args[1]
+        assert call_kwargs["permission_mode"] == "plan"
+        assert call_kwargs["allowed_tools"] == ["Read", "Write"]
+        assert call_kwargs["disallowed_tools"] == ["Bash"]
+        assert call_kwargs["max_turns"] == 10
+        assert call_kwargs["model"] == "claude-3-opus"
+        assert call_kwargs["system_prompt"] == "Be concise"
+        assert call_kwargs["resume_session"] == "previous-session-id"
+
+    async def test_run_headless_repo_not_found(self, client, repo_store):
         """Test running a headless session with non-existent repo."""
-        from fastapi import HTTPException
-
-        with patch("app.routers.headless.get_repo_or_404") as mock_get_repo:
-            mock_get_repo.side_effect = HTTPException(status_code=404, detail="Repository not found")
-
-            response = client.post(
-                "/headless/run",
-                json={
-                    "repo_id": 999,
-                    "prompt": "Analyze the codebase",
-                    "title": "Code Analysis",
-                }
-            )
+        response = await client.post(
+            "/headless/run", content=_MISSING_REPO_BODY, headers=_JSON_HEADERS
+        )
 
-            assert response.status_code == 404
-            assert "Repository not found" in response.json()["detail"]
+        assert response.status_code == 404
+        assert "Repository not found" in response.json()["detail"]
 
-    def test_run_headless_analyzer_exception(self, client, mock_repo):
+    async def test_run_headless_analyzer_exception(self, client, patched_deps):
         """Test handling exceptions from the analyzer."""
-        with patch("app.routers.headless.get_repo_or_404", return_value=mock_repo), \
-             patch("app.routers.headless.get_repo_db") as mock_db_ctx, \
-             patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-
-            mock_db = AsyncMock()
-            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_db.add = MagicMock()
-            mock_db.commit = AsyncMock()
-            mock_db.refresh = AsyncMock(side_effect=lambda s: setattr(s, 'id', 1))
-
-            mock_analyzer.analyze = AsyncMock(side_effect=Exception("Claude Code not found"))
-
-            response = client.post(
-                "/headless/run",
-                json={
-                    "repo_id": 1,
-                    "prompt": "Analyze the codebase",
-                    "title": "Code Analysis",
-                }
-            )
+        patched_deps.analyzer.analyze = AsyncMock(side_effect=Exception("Claude Code not found"))
 
-            assert response.status_code == 500
-            assert "Claude Code not found" in response.json()["detail"]
-
-    def test_run_headless_default_values(self, client, mock_repo, mock_session_result):
-        """Test that default values are applied correctly."""
-        with patch("app.routers.headless.get_repo_or_404", return_value=mock_repo), \
-             patch("app.routers.headless.get_repo_db") as mock_db_ctx, \
-             patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-
-            mock_db = AsyncMock()
-            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_db.add = MagicMock()
-            mock_db.commit = AsyncMock()
-            mock_db.refresh = AsyncMock(side_effect=lambda s: setattr(s, 'id', 1))
-
-            mock_analyzer.analyze = AsyncMock(return_value=mock_session_result)
-
-            # Only provide required fields
-            response = client.post(
-                "/headless/run",
-                json={
-                    "repo_id": 1,
-                    "prompt": "Hello",
-                }
-            )
+        response = await client.post("/headless/run", content=_RUN_BODY, headers=_JSON_HEADERS)
 
-            assert response.status_code == 200
+        assert response.status_code == 500
+        assert "Claude Code not found" in response.json()["detail"]
 
 
 class TestRunHeadlessSessionStream:
     """Tests for POST /headless/run/stream endpoint."""
 
-    def test_stream_headless_success(self, client, mock_repo):
+    async def test_stream_headless_success(self, client, patched_deps):
         """Test streaming a headless session successfully."""
         async def mock_stream(*args, **kwargs):
             yield SessionMessage(type="system", subtype="init", content="Starting")
@@ -293,145 +258,97 @@ class TestRunHeadlessSessionStream:
                 duration_ms=2000,
             )
 
-        with patch("app.routers.headless.get_repo_or_404", return_value=mock_repo), \
-             patch("app.routers.headless.get_repo_db") as mock_db_ctx, \
-             patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-
-            mock_db = AsyncMock()
-            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_db.add = MagicMock()
-            mock_db.commit = AsyncMock()
-            mock_db.refresh = AsyncMock(side_effect=lambda s: setattr(s, 'id', 1))
-
-            # Mock select query for session update
-            mock_result = MagicMock()
-            mock_session = MagicMock()
-            mock_result.scalar_one_or_none.return_value = mock_session
-            mock_db.execute = AsyncMock(return_value=mock_result)
-
-            mock_analyzer.analyze_stream = mock_stream
-
-            response = client.post(
-                "/headless/run/stream",
-                json={
-                    "repo_id": 1,
-                    "prompt": "Analyze",
-                    "title": "Analysis",
-                }
-            )
+        patched_deps.analyzer.analyze_stream = mock_stream
+
+        response = await client.post(
+            "/headless/run/stream", content=_STREAM_BODY, headers=_JSON_HEADERS
+        )
 
-            assert response.status_code == 200
-            assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
 
-            # Parse streaming response
-            lines = response.text.strip().split("\n")
-            messages = [json.loads(line) for line in lines if line]
+        # Parse streaming response
+        lines = response.text.strip().split("\n")
+        messages = [json.loads(line) for line in lines if line]
 
-            assert len(messages) == 3
-            assert messages[0]["type"] == "system"
-            assert messages[1]["type"] == "assistant"
-            assert messages[2]["type"] == "result"
-            assert messages[2]["subtype"] == "success"
-            assert messages[2]["content"] == "Done!"
+        assert len(messages) == 3
+        assert messages[0]["type"] == "system"
+        assert messages[1]["type"] == "assistant"
+        assert messages[2]["type"] == "result"
+        assert messages[2]["subtype"] == "success"
+        assert messages[2]["content"] == "Done!"
 
-    def test_stream_headless_with_error(self, client, mock_repo):
+    async def test_stream_headless_with_error(self, client, patched_deps):
         """Test streaming a headless session that encounters an error."""
         async def mock_stream(*args, **kwargs):
             yield SessionMessage(type="system", subtype="init", content="Starting")
             raise Exception("Connection lost")
 
-        with patch("app.routers.headless.get_repo_or_404", return_value=mock_repo), \
-             patch("app.routers.headless.get_repo_db") as mock_db_ctx, \
-             patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-
-            mock_db = AsyncMock()
-            mock_db_ctx.return_value.__aenter__ = AsyncMock(return_value=mock_db)
-            mock_db_ctx.return_value.__aexit__ = AsyncMock(return_value=None)
-            mock_db.add = MagicMock()
-            mock_db.commit = AsyncMock()
-            mock_db.refresh = AsyncMock(side_effect=lambda s: setattr(s, 'id', 1))
-
-            # Mock select query for session update
-            mock_result = MagicMock()
-            mock_session = MagicMock()
-            mock_result.scalar_one_or_none.return_value = mock_session
-            mock_db.execute = AsyncMock(return_value=mock_result)
-
-            mock_analyzer.analyze_stream = mock_stream
-
-            response = client.post(
-                "/headless/run/stream",
-                json={
-                    "repo_id": 1,
-                    "prompt": "Analyze",
-                    "title": "Analysis",
-                }
-            )
+        patched_deps.analyzer.analyze_stream = mock_stream
+
+        response = await client.post(
+            "/headless/run/stream", content=_STREAM_BODY, headers=_JSON_HEADERS
+        )
 
-            assert response.status_code == 200
+        assert response.status_code == 200
 
-            # Parse streaming response - should include error message
-            lines = response.text.strip().split("\n")
-            messages = [json.loads(line) for line in lines if line]
+        # Parse streaming response - should include error message
+        lines = response.text.strip().split("\n")
+        messages = [json.loads(line) for line in lines if line]
 
-            # Should have init message and error message
-            assert len(messages) >= 1
-            # Error should be in the stream
-            error_msg = next((m for m in messages if m["type"] == "error"), None)
-            assert error_msg is not None
-            assert "Connection lost" in error_msg["content"]
+        # Should have init message and error message
+        assert len(messages) >= 1
+        # Error should be in the stream
+        error_msg = next((m for m in messages if m["type"] == "error"), None)
+        assert error_msg is not None
+        assert "Connection lost" in error_msg["content"]
 
 
 class TestListRunningHeadlessSessions:
     """Tests for GET /headless/running endpoint."""
 
-    def test_list_running_sessions_empty(self, client):
+    async def test_list_running_sessions_empty(self, client, mock_analyzer):
         """Test listing running sessions when none are running."""
-        with patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-            mock_analyzer.list_running.return_value = []
+        mock_analyzer.list_running.return_value = []
 
-            response = client.get("/headless/running")
+        response = await client.get("/headless/running")
 
-            assert response.status_code == 200
-            assert response.json() == {"running": []}
+        assert response.status_code == 200
+        assert response.json() == {"running": []}
 
-    def test_list_running_sessions_with_sessions(self, client):
+    async def test_list_running_sessions_with_sessions(self, client, mock_analyzer):
         """Test listing running sessions when some are active."""
-        with patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-            mock_analyzer.list_running.return_value = ["session-1", "session-2", "session-3"]
+        mock_analyzer.list_running.return_value = ["session-1", "session-2", "session-3"]
 
-            response = client.get("/headless/running")
+        response = await client.get("/headless/running")
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data["running"] == ["session-1", "session-2", "session-3"]
-            assert len(data["running"]) == 3
+        assert response.status_code == 200
+        data = response.json()
+        assert data["running"] == ["session-1", "session-2", "session-3"]
+        assert len(data["running"]) == 3
 
 
 class TestCancelHeadlessSession:
     """Tests for DELETE /headless/{session_id} endpoint."""
 
-    def test_cancel_session_success(self, client):
+    async def test_cancel_session_success(self, client, mock_analyzer):
         """Test cancelling a running session successfully."""
-        with patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-            mock_analyzer.cancel = AsyncMock(return_value=True)
+        mock_analyzer.cancel = AsyncMock(return_value=True)
 
-            response = client.delete("/headless/session-123")
+        response = await client.delete("/headless/session-123")
 
-            assert response.status_code == 200
-            assert response.json() == {"status": "cancelled"}
-            mock_analyzer.cancel.assert_called_once_with("session-123")
+        assert response.status_code == 200
+        assert response.json() == {"status": "cancelled"}
+        mock_analyzer.cancel.assert_called_once_with("session-123")
 
-    def test_cancel_session_not_found(self, client):
+    async def test_cancel_session_not_found(self, client, mock_analyzer):
         """Test cancelling a session that doesn't exist."""
-        with patch("app.routers.headless.headless_analyzer") as mock_analyzer:
-            mock_analyzer.cancel = AsyncMock(return_value=False)
+        mock_analyzer.cancel = AsyncMock(return_value=False)
 
-            response = client.delete("/headless/nonexistent-session")
+        response = await client.delete("/headless/nonexistent-session")
 
-            assert response.status_code == 404
-            assert "not found or already completed" in response.json()["detail"]
+        assert response.status_code == 404
+        assert "not found or already completed" in response.json()["detail"]
 
 
 class TestHeadlessSessionCreate:
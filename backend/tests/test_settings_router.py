@@ -53,7 +53,7 @@ def mock_settings():
     mock.claude_headless_mode = False
     mock.claude_output_format = "stream-json"
     mock.claude_mcp_github = False
-    mock.get_allowed_tools.return_value = DEFAULT_ALLOWED_TOOLS
+    mock.get_allowed_tools.return_value = list(DEFAULT_ALLOWED_TOOLS)
     mock.get_disallowed_tools.return_value = []
     return mock
 
@@ -277,9 +277,9 @@ class TestClaudeSettingsEndpoints:
             assert data["headless_mode"] is False
             assert data["output_format"] == "stream-json"
             assert data["mcp_github"] is False
-            assert data["allowed_tools"] == DEFAULT_ALLOWED_TOOLS
+            assert data["allowed_tools"] == list(DEFAULT_ALLOWED_TOOLS)
             assert data["disallowed_tools"] == []
-            assert data["default_allowed_tools"] == DEFAULT_ALLOWED_TOOLS
+            assert data["default_allowed_tools"] == list(DEFAULT_ALLOWED_TOOLS)
 
     def test_get_claude_settings_custom_values(self, client):
         """Test getting Claude settings with custom values."""
@@ -376,7 +376,7 @@ class TestClaudeSettingsEndpoints:
             data = response.json()
             assert data["max_turns"] == 15
             # Empty allowed_tools returns defaults
-            assert data["allowed_tools"] == DEFAULT_ALLOWED_TOOLS
+            assert data["allowed_tools"] == list(DEFAULT_ALLOWED_TOOLS)
 
     def test_update_claude_settings_empty_tools_removes_from_config(self, client):
         """Test that empty allowed_tools removes the key from config."""